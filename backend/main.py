@@ -1,11 +1,16 @@
-from fastapi import FastAPI, HTTPException
+import asyncio
+from collections import deque
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+from pydantic_core import to_json
 from typing import List, Optional
 import uvicorn
-from scraper.cargurus_scraper import CarGurusScraper
-from scraper.models import ScrapedCar, InventorySearchRequest, InventorySearchResult, DealerInventoryRequest
+from scraper.cargurus_scraper import CarGurusScraper, shutdown_tile_pool
+from scraper.models import ScrapedCar, InventorySearchRequest, InventorySearchPagesRequest, InventorySearchResult, InventorySearchColumns, DealerInventoryRequest
 import logging
+import orjson
 import os
 
 
@@ -16,7 +21,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Car Lister API",
     description="Backend API for Car Lister PWA - CarGurus scraping service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for all possible frontend origins
@@ -25,8 +31,8 @@ import os
 # Get the environment to determine CORS settings
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
-# Configure CORS with specific allowed origins
-allow_origins = [
+# Configure CORS with specific allowed origins (a set, so Starlette's per-request origin check is a hash lookup)
+allow_origins = frozenset([
     "https://car-lister-be093.web.app",
     "https://car-lister-be093.firebaseapp.com",
     "https://car-lister.web.app",
@@ -38,7 +44,7 @@ allow_origins = [
     "http://127.0.0.1:5212",
     "http://127.0.0.1:3000",
     "http://127.0.0.1:5000"
-]
+])
 
 app.add_middleware(
     CORSMiddleware,
@@ -46,9 +52,16 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination headers sent with /api/inventory/search/stream
+    expose_headers=["X-Total-Results", "X-Current-Page", "X-Total-Pages", "X-Has-Next-Page"],
     max_age=3600
 )
 
+@app.on_event("shutdown")
+def _stop_tile_pool():
+    """Stop the scraper's tile workers, if a large page ever started them"""
+    shutdown_tile_pool()
+
 # Request/Response models
 class ScrapeRequest(BaseModel):
     url: str
@@ -60,9 +73,127 @@ class ScrapeResponse(BaseModel):
 
 
 
+def _model_response(content) -> Response:
+    """
+    Serialize response models (or lists of them) to JSON in one pydantic-core pass.
+    
+    Endpoints without a response_model otherwise run through jsonable_encoder, which dumps
+    the model and then walks every car again in Python before ORJSONResponse encodes it.
+    """
+    return Response(content=to_json(content), media_type="application/json")
+
 # Initialize scraper
 scraper = CarGurusScraper()
 
+# Dealer pages fetched in parallel by /api/dealer/inventory/all, capped to stay under CarGurus' rate limits
+DEALER_PAGE_CONCURRENCY = 8
+MAX_DEALER_PAGES = 25
+
+# Scraper calls allowed in flight against CarGurus at once across all requests; the rest
+# queue for a slot instead of bursting the upstream (and its anti-bot throttling)
+SCRAPE_CONCURRENCY = (os.cpu_count() or 1) * 2
+SCRAPE_SEM = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+# Queue metrics reported by /api/health: calls waiting for a slot, and recent waits in seconds
+_scrape_queue_depth = 0
+_scrape_wait_times = deque(maxlen=1000)
+
+async def _run_scraper(func, *args):
+    """Run a blocking scraper call in a worker thread once a SCRAPE_SEM slot is free"""
+    global _scrape_queue_depth
+    loop = asyncio.get_running_loop()
+    queued_at = loop.time()
+    _scrape_queue_depth += 1
+    try:
+        await SCRAPE_SEM.acquire()
+    finally:
+        _scrape_queue_depth -= 1
+    try:
+        _scrape_wait_times.append(loop.time() - queued_at)
+        return await asyncio.to_thread(func, *args)
+    finally:
+        SCRAPE_SEM.release()
+
+# Search pages batched by /api/inventory/search/pages: loads arriving within the window share
+# one batch, and at most SEARCH_BATCH_CONCURRENCY of a batch's pages are scraped at once
+SEARCH_BATCH_WINDOW = 0.01
+SEARCH_BATCH_CONCURRENCY = 8
+MAX_SEARCH_BATCH_PAGES = 10
+
+class InventoryBatcher:
+    """
+    DataLoader-style batcher for inventory search pages.
+    
+    load() calls made within SEARCH_BATCH_WINDOW of the first one are collected into a
+    batch. Requests with the same (zip, distance, srpVariation, newUsed, page) key, from
+    the same or concurrent clients, share one scrape, and the batch's distinct pages run
+    concurrently through _run_scraper.
+    """
+    
+    def __init__(self, window: float, concurrency: int):
+        self._window = window
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # search key -> (request, future) for the batch that hasn't been dispatched yet
+        self._pending = {}
+        self._flush_handle = None
+        # Keep references to running scrapes so they aren't garbage collected mid-flight
+        self._tasks = set()
+    
+    def load(self, request: InventorySearchRequest) -> asyncio.Future:
+        """Queue a search page for the next batch and return a future for its result"""
+        key = (request.zip, request.distance, request.pageNumber, request.srpVariation, request.newUsed)
+        pending = self._pending.get(key)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = self._pending[key] = (request, loop.create_future())
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self._window, self._dispatch)
+        # Shielded so one caller giving up doesn't cancel the result for the others
+        return asyncio.shield(pending[1])
+    
+    async def load_many(self, requests: List[InventorySearchRequest]) -> List[InventorySearchResult]:
+        """Load several search pages, returning their results in request order"""
+        results = await asyncio.gather(*(self.load(request) for request in requests), return_exceptions=True)
+        return [
+            result if not isinstance(result, Exception) else InventorySearchResult(
+                success=False,
+                errorMessage=f"Internal server error: {str(result)}",
+                currentPage=request.pageNumber,
+                processingTime=0.0
+            )
+            for request, result in zip(requests, results)
+        ]
+    
+    def _dispatch(self) -> None:
+        """Start a scrape for every distinct page collected in the current batch"""
+        batch, self._pending, self._flush_handle = self._pending, {}, None
+        logger.info("Dispatching inventory search batch of %s pages", len(batch))
+        for request, future in batch.values():
+            task = asyncio.create_task(self._scrape(request, future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _scrape(self, request: InventorySearchRequest, future: asyncio.Future) -> None:
+        """Scrape one search page and resolve its shared future"""
+        try:
+            async with self._semaphore:
+                result = await _run_scraper(scraper.search_inventory, request)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+inventory_batcher = InventoryBatcher(SEARCH_BATCH_WINDOW, SEARCH_BATCH_CONCURRENCY)
+
+def _scrape_queue_stats() -> dict:
+    """Current scrape queue depth and 95th-percentile wait over the recent calls"""
+    waits = sorted(_scrape_wait_times)
+    p95_wait = waits[min(len(waits) - 1, int(len(waits) * 0.95))] if waits else 0.0
+    return {
+        "concurrencyLimit": SCRAPE_CONCURRENCY,
+        "waiting": _scrape_queue_depth,
+        "p95WaitSeconds": round(p95_wait, 3)
+    }
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -85,20 +216,27 @@ async def scrape_cargurus(request: ScrapeRequest):
         ScrapeResponse with scraped car data or error
     """
     try:
-        logger.info(f"Starting scrape for URL: {request.url}")
+        logger.info("Starting scrape for URL: %s", request.url)
         
-        # Validate URL
-        if not request.url.startswith("https://www.cargurus.com"):
+        # Validate URL and extract the listing ID (memoized, so repeat requests skip URL parsing)
+        is_valid, listing_id = scraper.parse_cargurus_url(request.url)
+        if not is_valid:
             raise HTTPException(status_code=400, detail="Invalid CarGurus URL")
+        if not listing_id:
+            logger.warning("Could not extract listing ID from: %s", request.url)
+            return ScrapeResponse(
+                success=False,
+                error="Failed to extract car details from the provided URL"
+            )
         
-        # Scrape the car details
-        car_data = scraper.scrape_car(request.url)
+        # Scrape the car details in a worker thread so the blocking fetch doesn't stall the event loop
+        car_data = await _run_scraper(scraper.scrape_car_by_id, listing_id, request.url)
         
         if car_data:
-            logger.info(f"Successfully scraped: {car_data.make} {car_data.model} {car_data.year}")
-            return ScrapeResponse(success=True, data=car_data)
+            logger.info("Successfully scraped: %s %s %s", car_data.make, car_data.model, car_data.year)
+            return _model_response(ScrapeResponse(success=True, data=car_data))
         else:
-            logger.warning(f"Failed to scrape data from: {request.url}")
+            logger.warning("Failed to scrape data from: %s", request.url)
             return ScrapeResponse(
                 success=False, 
                 error="Failed to extract car details from the provided URL"
@@ -107,7 +245,7 @@ async def scrape_cargurus(request: ScrapeRequest):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error scraping {request.url}: {str(e)}")
+        logger.error("Error scraping %s: %s", request.url, e)
         return ScrapeResponse(
             success=False,
             error=f"Internal server error: {str(e)}"
@@ -125,88 +263,295 @@ async def search_inventory(request: InventorySearchRequest):
         InventorySearchResult with list of cars and pagination info
     """
     try:
-        logger.info(f"Starting inventory search: ZIP={request.zip}, Distance={request.distance}, Page={request.pageNumber}")
+        logger.info("Starting inventory search: ZIP=%s, Distance=%s, Page=%s", request.zip, request.distance, request.pageNumber)
         
         # Validate request parameters
-        if not request.zip or len(request.zip) != 5:
-            raise HTTPException(status_code=400, detail="Invalid ZIP code")
-        
-        if request.distance < 1 or request.distance > 500:
-            raise HTTPException(status_code=400, detail="Distance must be between 1 and 500 miles")
+        _validate_search_location(request)
         
         if request.pageNumber < 1:
             raise HTTPException(status_code=400, detail="Page number must be at least 1")
         
-        # Use the original search method
-        result = scraper.search_inventory(request)
+        # Use the original search method, off the event loop
+        result = await _run_scraper(scraper.search_inventory, request)
         
         if result.success:
-            logger.info(f"Successfully found {len(result.cars)} cars in inventory search")
-            return result
+            logger.info("Successfully found %s cars in inventory search", len(result.cars))
+            return _model_response(result)
         else:
-            logger.warning(f"Inventory search failed: {result.errorMessage}")
-            return result
+            logger.warning("Inventory search failed: %s", result.errorMessage)
+            return _model_response(result)
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in inventory search: {str(e)}")
+        logger.error("Error in inventory search: %s", e)
         return InventorySearchResult(
             success=False,
             errorMessage=f"Internal server error: {str(e)}",
             processingTime=0.0
         )
 
-@app.post("/api/dealer/inventory")
-async def scrape_dealer_inventory(request: DealerInventoryRequest):
+@app.post("/api/inventory/search/columns")
+async def search_inventory_columns(request: InventorySearchRequest):
     """
-    Scrape inventory from a specific dealer using the improved AJAX method.
+    Search CarGurus inventory, returning the cars as columns.
+    
+    Runs the same (cached) search as /api/inventory/search, then pivots the cars into
+    one list per field, which is smaller on the wire and suits clients that filter or
+    sort a whole page at once.
     
     Args:
-        request: DealerInventoryRequest containing dealer entity ID, name, URL and page number
+        request: InventorySearchRequest containing search parameters
         
     Returns:
-        InventorySearchResult with list of cars and pagination info
+        InventorySearchColumns with per-field car columns and pagination info
     """
     try:
-        logger.info(f"Starting dealer inventory scrape: Dealer ID={request.dealerEntityId}, Name={request.dealerName}, Page={request.pageNumber}")
+        logger.info("Starting columnar inventory search: ZIP=%s, Distance=%s, Page=%s", request.zip, request.distance, request.pageNumber)
         
         # Validate request parameters
-        if not request.dealerEntityId:
-            raise HTTPException(status_code=400, detail="Dealer entity ID is required")
+        _validate_search_location(request)
         
-        if not request.dealerName:
-            raise HTTPException(status_code=400, detail="Dealer name is required")
+        if request.pageNumber < 1:
+            raise HTTPException(status_code=400, detail="Page number must be at least 1")
+        
+        result = await _run_scraper(scraper.search_inventory, request)
+        if not result.success:
+            logger.warning("Inventory search failed: %s", result.errorMessage)
+        return _model_response(InventorySearchColumns.from_result(result))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error in columnar inventory search: %s", e)
+        return InventorySearchColumns(
+            success=False,
+            errorMessage=f"Internal server error: {str(e)}",
+            processingTime=0.0
+        )
+
+@app.post("/api/inventory/search/stream")
+async def search_inventory_stream(request: InventorySearchRequest):
+    """
+    Search CarGurus inventory, streaming the cars back as NDJSON.
+    
+    Each car is serialized and sent on its own line as the response is written, so
+    clients can render the first car before the last one is encoded. The pagination
+    fields that would otherwise wrap the cars are sent as X-Total-Results,
+    X-Current-Page, X-Total-Pages and X-Has-Next-Page headers. Failed searches return
+    the usual InventorySearchResult JSON instead.
+    
+    Args:
+        request: InventorySearchRequest containing search parameters
         
-        if not request.dealerUrl:
-            raise HTTPException(status_code=400, detail="Dealer URL is required")
+    Returns:
+        StreamingResponse of application/x-ndjson car lines, or InventorySearchResult on failure
+    """
+    try:
+        logger.info("Starting streamed inventory search: ZIP=%s, Distance=%s, Page=%s", request.zip, request.distance, request.pageNumber)
         
-        if not request.dealerUrl.startswith("https://www.cargurus.com"):
-            raise HTTPException(status_code=400, detail="Invalid CarGurus dealer URL")
+        # Validate request parameters
+        _validate_search_location(request)
         
         if request.pageNumber < 1:
             raise HTTPException(status_code=400, detail="Page number must be at least 1")
         
-        # Scrape the dealer inventory using the new AJAX method
-        result = scraper.scrape_dealer_page(request.dealerEntityId, request.dealerUrl, request.pageNumber, request.inventoryType)
+        result = await _run_scraper(scraper.search_inventory, request)
+        if not result.success:
+            logger.warning("Inventory search failed: %s", result.errorMessage)
+            return result
+        
+        logger.info("Streaming %s cars from inventory search", len(result.cars))
+        return StreamingResponse(
+            _ndjson_cars(result.cars),
+            media_type="application/x-ndjson",
+            headers={
+                "X-Total-Results": str(result.totalResults),
+                "X-Current-Page": str(result.currentPage),
+                "X-Total-Pages": str(result.totalPages),
+                "X-Has-Next-Page": "true" if result.hasNextPage else "false"
+            }
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error in streamed inventory search: %s", e)
+        return InventorySearchResult(
+            success=False,
+            errorMessage=f"Internal server error: {str(e)}",
+            processingTime=0.0
+        )
+
+async def _ndjson_cars(cars: List[ScrapedCar]):
+    """Yield each car as one orjson-encoded NDJSON line"""
+    for car in cars:
+        yield orjson.dumps(car.model_dump()) + b"\n"
+
+@app.post("/api/inventory/search/pages")
+async def search_inventory_pages(request: InventorySearchPagesRequest):
+    """
+    Search several pages of CarGurus inventory in one call.
+    
+    The pages go through inventory_batcher, so they are fetched concurrently and pages
+    already being fetched for another client are shared rather than requested again.
+    
+    Args:
+        request: InventorySearchPagesRequest containing search parameters and page numbers
+        
+    Returns:
+        List of InventorySearchResult, one per requested page number in request order
+    """
+    logger.info("Starting batched inventory search: ZIP=%s, Distance=%s, Pages=%s", request.zip, request.distance, request.pageNumbers)
+    
+    # Validate request parameters
+    _validate_search_location(request)
+    
+    if len(request.pageNumbers) > MAX_SEARCH_BATCH_PAGES:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_SEARCH_BATCH_PAGES} pages can be requested at once")
+    
+    if any(page_number < 1 for page_number in request.pageNumbers):
+        raise HTTPException(status_code=400, detail="Page numbers must be at least 1")
+    
+    results = await inventory_batcher.load_many([request.page_request(page) for page in request.pageNumbers])
+    logger.info("Batched inventory search found %s cars across %s pages", sum(len(result.cars) for result in results), len(results))
+    return _model_response(results)
+
+def _validate_search_location(request) -> None:
+    """Reject inventory searches with a malformed ZIP code or out-of-range distance"""
+    if not request.zip or len(request.zip) != 5:
+        raise HTTPException(status_code=400, detail="Invalid ZIP code")
+    
+    if request.distance < 1 or request.distance > 500:
+        raise HTTPException(status_code=400, detail="Distance must be between 1 and 500 miles")
+
+@app.post("/api/dealer/inventory")
+async def scrape_dealer_inventory(request: DealerInventoryRequest):
+    """
+    Scrape inventory from a specific dealer using the improved AJAX method.
+    
+    Args:
+        request: DealerInventoryRequest containing dealer entity ID, name, URL and page number
+        
+    Returns:
+        InventorySearchResult with list of cars and pagination info
+    """
+    try:
+        logger.info("Starting dealer inventory scrape: Dealer ID=%s, Name=%s, Page=%s", request.dealerEntityId, request.dealerName, request.pageNumber)
+        
+        # Validate request parameters
+        _validate_dealer_request(request)
+        
+        # Scrape the dealer inventory using the new AJAX method, off the event loop
+        result = await _run_scraper(
+            scraper.scrape_dealer_page, request.dealerEntityId, request.dealerUrl, request.pageNumber, request.inventoryType
+        )
         
         if result.success:
-            logger.info(f"Successfully found {len(result.cars)} cars from dealer {request.dealerName}")
-            return result
+            logger.info("Successfully found %s cars from dealer %s", len(result.cars), request.dealerName)
+            return _model_response(result)
         else:
-            logger.warning(f"Dealer inventory scrape failed: {result.errorMessage}")
-            return result
+            logger.warning("Dealer inventory scrape failed: %s", result.errorMessage)
+            return _model_response(result)
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in dealer inventory scrape: {str(e)}")
+        logger.error("Error in dealer inventory scrape: %s", e)
+        return InventorySearchResult(
+            success=False,
+            errorMessage=f"Internal server error: {str(e)}",
+            processingTime=0.0
+        )
+
+@app.post("/api/dealer/inventory/all")
+async def scrape_all_dealer_inventory(request: DealerInventoryRequest):
+    """
+    Scrape every inventory page of a dealer, starting at request.pageNumber.
+    
+    The first page is fetched on its own to learn the page count; the remaining pages
+    (up to MAX_DEALER_PAGES in total) are then fetched concurrently, at most
+    DEALER_PAGE_CONCURRENCY at a time, and their cars combined in page order.
+    
+    Args:
+        request: DealerInventoryRequest containing dealer entity ID, name, URL and first page number
+        
+    Returns:
+        InventorySearchResult with the cars from all fetched pages
+    """
+    try:
+        logger.info("Starting full dealer inventory scrape: Dealer ID=%s, Name=%s, From page=%s", request.dealerEntityId, request.dealerName, request.pageNumber)
+        
+        _validate_dealer_request(request)
+        
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        first_page = await _run_scraper(
+            scraper.scrape_dealer_page, request.dealerEntityId, request.dealerUrl, request.pageNumber, request.inventoryType
+        )
+        if not first_page.success:
+            logger.warning("Dealer inventory scrape failed: %s", first_page.errorMessage or first_page.message)
+            return first_page
+        
+        last_page = min(first_page.totalPages, request.pageNumber + MAX_DEALER_PAGES - 1)
+        semaphore = asyncio.Semaphore(DEALER_PAGE_CONCURRENCY)
+        
+        async def fetch_page(page_number: int) -> InventorySearchResult:
+            async with semaphore:
+                return await _run_scraper(
+                    scraper.scrape_dealer_page, request.dealerEntityId, request.dealerUrl, page_number, request.inventoryType
+                )
+        
+        pages = [first_page]
+        pages.extend(await asyncio.gather(*(fetch_page(page) for page in range(request.pageNumber + 1, last_page + 1))))
+        
+        cars = []
+        for page in pages:
+            if page.success:
+                cars.extend(page.cars)
+            else:
+                logger.warning("Skipping failed dealer page %s: %s", page.currentPage, page.errorMessage or page.message)
+        
+        logger.info("Successfully found %s cars across %s pages from dealer %s", len(cars), len(pages), request.dealerName)
+        return _model_response(InventorySearchResult(
+            success=True,
+            cars=cars,
+            totalResults=first_page.totalResults,
+            currentPage=request.pageNumber,
+            totalPages=first_page.totalPages,
+            hasNextPage=last_page < first_page.totalPages,
+            hasPreviousPage=request.pageNumber > 1,
+            processingTime=loop.time() - start_time,
+            message=f"Successfully scraped {len(cars)} cars from dealer pages {request.pageNumber}-{last_page} (Total: {first_page.totalResults})"
+        ))
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error in full dealer inventory scrape: %s", e)
         return InventorySearchResult(
             success=False,
             errorMessage=f"Internal server error: {str(e)}",
             processingTime=0.0
         )
 
+def _validate_dealer_request(request: DealerInventoryRequest) -> None:
+    """Reject dealer inventory requests with missing or non-CarGurus fields"""
+    if not request.dealerEntityId:
+        raise HTTPException(status_code=400, detail="Dealer entity ID is required")
+    
+    if not request.dealerName:
+        raise HTTPException(status_code=400, detail="Dealer name is required")
+    
+    if not request.dealerUrl:
+        raise HTTPException(status_code=400, detail="Dealer URL is required")
+    
+    if not request.dealerUrl.startswith("https://www.cargurus.com"):
+        raise HTTPException(status_code=400, detail="Invalid CarGurus dealer URL")
+    
+    if request.pageNumber < 1:
+        raise HTTPException(status_code=400, detail="Page number must be at least 1")
+
 @app.get("/api/health")
 async def health_check():
     """Detailed health check for monitoring"""
@@ -214,7 +559,8 @@ async def health_check():
         "status": "healthy",
         "service": "car-lister-api",
         "version": "1.0.0",
-        "timestamp": "2024-01-01T00:00:00Z"
+        "timestamp": "2024-01-01T00:00:00Z",
+        "scrapeQueue": _scrape_queue_stats()
     }
 
 
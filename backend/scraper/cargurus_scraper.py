@@ -1,19 +1,510 @@
-import json
 import logging
+import multiprocessing
+import os
 import re
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
+from typing import List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
-from .models import InventorySearchRequest, InventorySearchResult, ScrapedCar
+from .models import InventorySearchRequest, InventorySearchResult, ScrapedCar, ScrapedCarRow
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+except ImportError:  # orjson has no PyPy build; the stdlib parser keeps the scraper importable there
+    import json
+    _json_loads = json.loads
+    # json.loads raises UnicodeDecodeError (not JSONDecodeError) for undecodable bytes
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
 
 logger = logging.getLogger(__name__)
 
+# Patterns used to classify search tiles and scan search/dealer page HTML
+_LISTING_TILE_RE = re.compile(r'LISTING_')
+_INVENTORY_LISTING_HREF_RE = re.compile(r'href="([^"]*inventorylisting[^"]*)"')
+_INITIAL_STATE_RE = re.compile(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', re.DOTALL)
+_EMBEDDED_JSON_RES = (
+    _INITIAL_STATE_RE,
+    re.compile(r'window\.__PRELOADED_STATE__\s*=\s*({.*?});', re.DOTALL),
+    re.compile(r'window\.cgData\s*=\s*({.*?});', re.DOTALL),
+    re.compile(r'var\s+listingData\s*=\s*(\[.*?\]);', re.DOTALL),
+)
+# searchId and pageReceipt are both collected in a single pass over the dealer page
+_SEARCH_PARAMS_RE = re.compile(
+    r'(?:searchId["\']?\s*[:=]\s*["\'](?P<searchId>[^"\']+)["\'])'
+    r'|(?:pageReceipt["\']?\s*[:=]\s*["\'](?P<pageReceipt>[^"\']+)["\'])'
+)
+
+# Case-insensitive match for div/article class values that look like a dealer-page listing container
+_LISTING_CONTAINER_CLASS_RE = re.compile(r'listing|card|tile|car', re.I)
+# Only listing containers (and their descendants) are built when parsing dealer pages
+_LISTING_CONTAINER_STRAINER = SoupStrainer(['div', 'article'], class_=_LISTING_CONTAINER_CLASS_RE)
+
+
+def _parse_listing_id_param(url: str) -> str:
+    """Read the value of a listingId= query parameter (e.g. ?listingId=123456789)"""
+    start = url.find('listingId=') + len('listingId=')
+    end = url.find('&', start)
+    if end == -1:
+        end = url.find('#', start)
+    if end == -1:
+        end = len(url)
+    return url[start:end]
+
+
+def _parse_listing_fragment(marker: str):
+    """Build a reader for listing=ID/... segments (e.g. #listing=123456789/NONE/DEFAULT)"""
+    def parse(url: str) -> str:
+        start = url.find(marker) + len(marker)
+        end = url.find('/', start)
+        if end == -1:
+            end = len(url)
+        return url[start:end]
+    return parse
+
+
+# Cheap substring markers tried in order before falling back to the regexes below
+_LISTING_ID_MARKERS = (
+    ('listingId=', _parse_listing_id_param),
+    ('/listing=', _parse_listing_fragment('/listing=')),
+    ('#listing=', _parse_listing_fragment('#listing=')),
+)
+_LISTING_ID_PATH_RES = (
+    re.compile(r'/l-(\d+)'),  # /l-123456789
+    re.compile(r'/listing/(\d+)'),  # /listing/123456789
+    re.compile(r'/inventorylisting/(\d+)'),  # /inventorylisting/123456789
+)
+_LISTING_ID_QUERY_RES = (
+    re.compile(r'[?&]id=(\d+)'),
+    re.compile(r'[?&]listing=(\d+)'),
+    re.compile(r'[?&]inventoryId=(\d+)'),
+)
+_LISTING_ID_DIGITS_RE = re.compile(r'(\d{6,})')
+
+# Patterns used by the dealer/AJAX HTML fallbacks, title parsing and page totals
+_PRICE_RE = re.compile(r'\$([\d,]+)')
+_CONTAINER_MAKE_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_CONTAINER_MODEL_RE = re.compile(r'\b[A-Z][a-z0-9\s\-]+\b')
+_CONTAINER_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_HTML_CAR_RE = re.compile(r'<[^>]*>([^<]*?)\s+([^<]*?)\s+((?:19|20)\d{2})[^<]*</[^>]*>', re.IGNORECASE)
+# Bounded so a stray "pagination" in a large HTML page can't trigger a long rescan
+_PAGINATION_RE = re.compile(r'pagination["\']?\s*[:=]\s*(\{[^}]{0,4096}\})')
+_PAGINATION_CLASS_RE = re.compile(r'pagination', re.I)
+# Only pagination blocks (and their children) are built for the pagination HTML fallback
+_PAGINATION_STRAINER = SoupStrainer(['div', 'nav'], class_=_PAGINATION_CLASS_RE)
+_PAGE_NUMBER_RE = re.compile(r'\d+')
+_NEXT_BUTTON_RE = re.compile(r'next|>', re.I)
+_DEALER_NAME_MARKER = 'class="dealerName"'
+_DEALER_NAME_WINDOW = 2048
+_CARS_FOR_SALE_RE = re.compile(r'(\d+)\s+Cars?\s+for\s+Sale', re.IGNORECASE)
+
+# Constant strings used when building cars from tiles
+_PLACEHOLDER_IMG = "https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop"
+_CARS_URL = "https://www.cargurus.com/Cars"
+_LISTING_URL_PREFIX = "https://www.cargurus.com/Cars/inventorylisting/vdp.action?listingId="
+
+
+def _class_contains_any(keywords) -> str:
+    """XPath predicate matching elements whose lowercased class contains any keyword"""
+    lowered = "translate(@class, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return ' or '.join(f"contains({lowered}, '{keyword}')" for keyword in keywords)
+
+
+# Compiled XPath queries for the AJAX response HTML fallback
+_AJAX_CONTAINER_XPATH = etree.XPath(
+    f"//*[self::div or self::article][{_class_contains_any(('listing', 'card', 'tile', 'car', 'result'))}]"
+)
+_AJAX_TITLE_XPATH = etree.XPath(
+    f".//*[self::h3 or self::h4 or self::h5 or self::div][{_class_contains_any(('title', 'name', 'heading'))}]"
+)
+_AJAX_PRICE_XPATH = etree.XPath(
+    f".//*[self::span or self::div][{_class_contains_any(('price', 'cost'))}]"
+)
+_AJAX_DESC_XPATH = etree.XPath(
+    f".//*[self::p or self::div][{_class_contains_any(('description', 'desc', 'summary'))}]"
+)
+
+
+def _decode_json_payload(payload: Union[str, bytes]) -> Optional[dict]:
+    """Decode a JSON object payload, or return None if the payload is not JSON"""
+    if payload.lstrip()[:1] not in ('{', '[', b'{', b'['):
+        return None
+    try:
+        return _json_loads(payload)
+    except _JSON_DECODE_ERRORS as e:
+        logger.warning("Failed to parse response as JSON: %s", e)
+        return None
+
+
+def _element_text(element) -> str:
+    """Concatenate an lxml element's stripped text nodes (like bs4 get_text(strip=True))"""
+    return ''.join(text.strip() for text in element.itertext())
+
+# Defaults for the detail-listing fields read by _extract_car_data_from_json.
+# Merging these under the listing lets a single itemgetter call unpack every
+# field instead of issuing one .get() per field.
+_LISTING_DEFAULTS = {
+    'year': 0,
+    'makeName': 'Unknown',
+    'modelName': None,
+    'listingTitleOnly': '',
+    'trimName': '',
+    'price': 0.0,
+    'description': 'No description available.',
+    'localizedExteriorColor': '',
+    'localizedInteriorColor': '',
+}
+_LISTING_GET = itemgetter(*_LISTING_DEFAULTS)
+_AUTO_ENTITY_GET = itemgetter('year', 'make', 'model', 'trim', 'bodyStyle')
+
+# Condition stat derived from the AJAX tile type, and the (header, tile key) pairs read into stats
+_TILE_CONDITIONS = {
+    'LISTING_NEW_STANDARD': 'New',
+    'LISTING_USED_STANDARD': 'Used',
+}
+_TILE_STAT_FIELDS = (
+    ("Mileage", 'mileageString'),
+    ("Transmission", 'localizedTransmission'),
+    ("Drivetrain", 'localizedDriveTrain'),
+    ("Fuel Type", 'localizedFuelType'),
+    ("Engine", 'localizedEngineDisplayName'),
+)
+
+# Fixed fragments of the stats rows built by _extract_stats_from_json
+_STATS_CATEGORY_PREFIX = "📋 "
+_STATS_OPTIONS_PREFIX = "🔧 "
+_STATS_OPTIONS_SUFFIX = " Options"
+_STATS_OPTION_BULLET = "  • "
+_STATS_OPTION_CHECK = "✓"
+
+
+# Pages with more tiles than this are decoded in a process pool; typical dealer pages
+# (23 listings) stay in-process where pickling would cost more than it saves
+_TILE_POOL_THRESHOLD = 128
+# Workers start from a forkserver (spawn where that's unavailable): the scraper runs in
+# asyncio.to_thread workers, and forking that multithreaded process could copy a lock another
+# thread holds (logging, the urllib3 pool) into the child and deadlock it.
+_TILE_POOL_WORKERS = os.cpu_count() or 1
+_TILE_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+# Created on the first large page rather than at import, so importers don't start workers they never use
+_tile_pool: Optional[ProcessPoolExecutor] = None
+_tile_pool_lock = threading.Lock()
+
+
+def _get_tile_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared tile pool, creating it on first use (None on single-CPU hosts)"""
+    global _tile_pool
+    if _TILE_POOL_WORKERS <= 1:
+        return None
+    with _tile_pool_lock:
+        if _tile_pool is None:
+            _tile_pool = ProcessPoolExecutor(max_workers=_TILE_POOL_WORKERS,
+                                             mp_context=multiprocessing.get_context(_TILE_POOL_START_METHOD))
+        return _tile_pool
+
+
+def shutdown_tile_pool() -> None:
+    """Stop the tile pool's workers if it was ever started; call on app shutdown"""
+    global _tile_pool
+    with _tile_pool_lock:
+        if _tile_pool is not None:
+            _tile_pool.shutdown()
+            _tile_pool = None
+
+
+# Connection pool shared by every scraper session, so keep-alive connections (and
+# their TLS handshakes) to CarGurus are reused across scraper instances. Sessions stay
+# per instance because the scraper sets per-request headers on them.
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+
+# Scraped cars are reused for repeat requests of the same listing for a few minutes
+_SCRAPE_CACHE_TTL = 300
+_SCRAPE_CACHE_MAXSIZE = 1024
+# URL validation and listing-ID results kept for recently seen URLs
+_URL_PARSE_CACHE_SIZE = 8192
+# Search pages are re-requested by UI pagination; failed searches are only kept for seconds
+_SEARCH_CACHE_TTL = 120
+_SEARCH_CACHE_ERROR_TTL = 15
+_SEARCH_CACHE_MAXSIZE = 512
+
+# Browser-like XHR headers sent on top of the session defaults. They are passed per request
+# rather than written into the shared session, which concurrent scrapes would race on.
+_XHR_HEADERS = {
+    'accept': '*/*',
+    'accept-language': 'en-US,en;q=0.9',
+    'cache-control': 'no-cache',
+    'pragma': 'no-cache',
+    'sec-ch-device-memory': '8',
+    'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
+    'sec-ch-ua-arch': '"x86"',
+    'sec-ch-ua-full-version-list': '"Not)A;Brand";v="8.0.0.0", "Chromium";v="138.0.7204.188", "Google Chrome";v="138.0.7204.188"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-model': '""',
+    'sec-ch-ua-platform': '"Windows"',
+    'sec-fetch-dest': 'empty',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'same-origin',
+    'x-cg-client-id': 'site-cars',
+    'x-requested-with': 'XMLHttpRequest',
+}
+# Inventory search (matches the successful curl command)
+_SEARCH_HEADERS = {**_XHR_HEADERS, 'dnt': '1', 'priority': 'u=1, i'}
+# Dealer inventory AJAX pages; the dealer page URL is added as the referer
+_DEALER_AJAX_HEADERS = {**_XHR_HEADERS, 'origin': 'https://www.cargurus.com'}
+
+
+def _extract_car_from_ajax_tile_data(car_data: dict, dealer_entity_id: str = "", tile_type: str = "",
+                                     scraped_at: Optional[datetime] = None) -> Optional[ScrapedCarRow]:
+    """
+    Extract car data from a single tile in the AJAX JSON response.
+    """
+    try:
+        # Extract basic car information
+        make = car_data.get('makeName', '')
+        model = car_data.get('modelName', '')
+        year = car_data.get('carYear', 0)
+        price = car_data.get('price', 0.0)
+        
+        # Validate that we have at least basic information before building the rest of the row
+        if not make or not model or year == 0:
+            logger.warning("Insufficient car data in tile: make=%s, model=%s, year=%s", make, model, year)
+            return None
+        # Rows skip model validation, so reject what ScrapedCar's limits used to reject before doing the work
+        if price is None or price < 0 or year is None or not 1900 <= year <= 2030:
+            logger.warning("Out-of-range car data in tile: year=%s, price=%s", year, price)
+            return None
+        
+        # Extract listing ID for URL construction
+        listing_id = car_data.get('id', '')
+        
+        # Extract description/title
+        description = car_data.get('listingTitle', '')
+        if not description:
+            description = f"{year} {make} {model}"
+        
+        # Extract features from options
+        features = car_data.get('options', [])
+        
+        # Extract stats, starting with the condition based on tile type (CRITICAL FIX!)
+        condition = _TILE_CONDITIONS.get(tile_type)
+        stats = [{"header": "Condition", "value": condition}] if condition else []
+        for header, key in _TILE_STAT_FIELDS:
+            value = car_data.get(key)
+            if value:
+                stats.append({"header": header, "value": value})
+        
+        # Extract vehicle appearance details
+        exterior_color = car_data.get('localizedExteriorColor', '')
+        interior_color = car_data.get('localizedInteriorColor', '')
+        # Note: bodyStyle is not in the tile data, but may be added if available
+        body_style = car_data.get('bodyStyle', '')
+        
+        # Extract images (collect all, not just primary)
+        images = []
+        original_picture = car_data.get('originalPictureData', {})
+        if original_picture and original_picture.get('url'):
+            images.append(original_picture['url'])
+
+        # Additional sources commonly present on tiles
+        # 1) pictures: [{ url: ... }]
+        pictures = car_data.get('pictures') or car_data.get('pictureData') or []
+        if isinstance(pictures, list):
+            for pic in pictures:
+                if isinstance(pic, dict):
+                    url = pic.get('url') or pic.get('imageUrl') or pic.get('src') or pic.get('photoUrl')
+                    if url:
+                        images.append(url)
+                elif isinstance(pic, str) and pic:
+                    images.append(pic)
+
+        # 2) other potential fields that sometimes hold arrays/objects of image urls
+        for field in ['images', 'photos', 'gallery', 'imageGallery', 'additionalImages']:
+            field_data = car_data.get(field)
+            if not field_data:
+                continue
+            if isinstance(field_data, list):
+                for item in field_data:
+                    if isinstance(item, dict):
+                        for key in ['url', 'imageUrl', 'photoUrl', 'src']:
+                            u = item.get(key)
+                            if u:
+                                images.append(u)
+                    elif isinstance(item, str):
+                        images.append(item)
+            elif isinstance(field_data, dict):
+                for key in ['url', 'imageUrl', 'photoUrl', 'src']:
+                    u = field_data.get(key)
+                    if u:
+                        images.append(u)
+        # Drop repeats in one pass, keeping first-seen order
+        images = list(dict.fromkeys(images))
+        
+        # Extract VIN and stock number
+        vin = car_data.get('vin', '')
+        stock_number = car_data.get('stockNumber', '')
+        
+        # Construct the full title
+        trim = car_data.get('trimName', '')
+        if trim and trim.strip():
+            full_title = f"{year} {make} {model} {trim}".strip()
+        else:
+            full_title = f"{year} {make} {model}".strip()
+        
+        # Construct the original CarGurus URL
+        original_url = ""
+        if listing_id and dealer_entity_id:
+            original_url = f"{_LISTING_URL_PREFIX}{listing_id}&entitySelectingHelper.selectedEntity=sp{dealer_entity_id}#listing={listing_id}/NONE/DEFAULT"
+        elif listing_id:
+            # Fallback URL without dealer entity if not provided
+            original_url = f"{_LISTING_URL_PREFIX}{listing_id}#listing={listing_id}/NONE/DEFAULT"
+        
+        logger.debug("Extracted car: %s - $%s - URL: %s", full_title, price, original_url)
+        logger.debug("Extracted colors - Exterior: %s, Interior: %s, Body Style: %s", exterior_color, interior_color, body_style)
+        
+        return ScrapedCarRow(
+            make=make,
+            model=model,
+            year=year,
+            price=price,
+            description=description,
+            features=features,
+            stats=stats,
+            images=images,
+            originalUrl=original_url,
+            fullTitle=full_title,
+            exteriorColor=exterior_color,
+            interiorColor=interior_color,
+            bodyStyle=body_style,
+            scrapedAt=scraped_at or datetime.now()
+        )
+            
+    except Exception as e:
+        logger.warning("Error extracting car from tile data: %s", e)
+        
+    return None
+
+
+# Tile type -> extractor for the AJAX JSON tiles that carry a car listing
+_TILE_EXTRACTORS = {
+    'LISTING_USED_STANDARD': _extract_car_from_ajax_tile_data,
+    'LISTING_NEW_STANDARD': _extract_car_from_ajax_tile_data,
+}
+
+
+def _extract_cars_from_ajax_tiles(tiles: List[dict], dealer_entity_id: str = "",
+                                  scraped_at: Optional[datetime] = None) -> List[ScrapedCarRow]:
+    """
+    Extract car rows from a run of AJAX JSON tiles, all stamped with the same scraped_at.
+    Module-level (and free of scraper state) so large pages can be split across worker processes.
+    """
+    scraped_at = scraped_at or datetime.now()
+    # Only car listing tiles have an extractor; MERCH (advertisement) and unknown tiles are skipped.
+    # The extractor catches its own errors and returns None for tiles it can't use.
+    return [
+        car for car in (
+            _TILE_EXTRACTORS[tile['type']](tile.get('data', {}), dealer_entity_id, tile['type'], scraped_at)  # Pass the tile type!
+            for tile in tiles if tile.get('type') in _TILE_EXTRACTORS
+        ) if car is not None
+    ]
+
+
+# Tile fields that may hold extra images, and the keys an image entry may keep its URL under
+_JSON_TILE_IMAGE_FIELDS = ('images', 'photos', 'pictureData', 'gallery', 'imageGallery', 'additionalImages')
+_JSON_TILE_IMAGE_URL_KEYS = ('url', 'src', 'imageUrl', 'photoUrl')
+
+
+def _extract_car_from_json_tile_data(tile_data: dict, scraped_at: Optional[datetime] = None) -> Optional[ScrapedCarRow]:
+    """
+    Extract a car row from a single search-response JSON tile.
+    Pure dict reads with no scraper state and no per-tile INFO logging, since it runs
+    once per tile of every search page.
+    """
+    try:
+        get = tile_data.get
+        
+        # Extract basic car information
+        make = get('makeName', 'Unknown')
+        model = get('modelName', 'Unknown')
+        year = get('carYear', 2024)
+        price = get('price', 0.0)
+        
+        # Extract title (also used as the description)
+        title = get('listingTitle', '')
+        if not title:
+            title = f"{year} {make} {model}"
+        
+        # Primary image from originalPictureData, then any additional image fields
+        images = []
+        seen = set()
+        original_picture_data = get('originalPictureData', {})
+        if original_picture_data and isinstance(original_picture_data, dict):
+            image_url = original_picture_data.get('url', '')
+            if image_url:
+                images.append(image_url)
+                seen.add(image_url)
+        
+        for field in _JSON_TILE_IMAGE_FIELDS:
+            field_data = get(field)
+            if isinstance(field_data, list):
+                entries = field_data
+            elif isinstance(field_data, dict):
+                entries = (field_data,)
+            else:
+                continue
+            for item in entries:
+                if isinstance(item, dict):
+                    for url_key in _JSON_TILE_IMAGE_URL_KEYS:
+                        image_url = item.get(url_key)
+                        if image_url and image_url not in seen:
+                            seen.add(image_url)
+                            images.append(image_url)
+                elif isinstance(item, str) and item not in seen:
+                    seen.add(item)
+                    images.append(item)
+        
+        # If no images found, add placeholder
+        if not images:
+            images.append(_PLACEHOLDER_IMG)
+        
+        # Extract URL (construct from listing ID)
+        listing_id = get('id', '')
+        original_url = f"{_LISTING_URL_PREFIX}{listing_id}&entitySelectingHelper.selectedEntity=m6#listing={listing_id}/NONE/DEFAULT" if listing_id else _CARS_URL
+        
+        logger.debug("Extracted car from JSON tile: %s %s %s - $%s (%s images)", make, model, year, price, len(images))
+        return ScrapedCarRow(
+            make=make,
+            model=model,
+            year=year,
+            price=price,
+            description=title,
+            features=get('options', []),
+            images=images,
+            originalUrl=original_url,
+            fullTitle=title,
+            scrapedAt=scraped_at or datetime.now()
+        )
+        
+    except Exception as e:
+        logger.warning("Error extracting car from JSON tile: %s", e)
+        return None
+
+
 class CarGurusScraper:
     """
     Professional CarGurus.com scraper using the JSON API endpoint.
@@ -24,51 +515,140 @@ class CarGurusScraper:
     
     def __init__(self):
         self.session = requests.Session()
+        self.session.mount('https://', _HTTP_ADAPTER)
+        self.session.mount('http://', _HTTP_ADAPTER)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/javascript, */*; q=0.01',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
+            # Only advertises br when a Brotli decoder is installed for urllib3 to use
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Referer': 'https://www.cargurus.com/',
         }
         self.session.headers.update(self.headers)
         self.max_retries = 3
         self.timeout = 30
+        # listing ID (or URL) -> (expiry, car), oldest first; guarded by _cache_lock along with _url_locks
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._url_locks = {}
+        # search key -> (expiry, result), oldest first; also guarded by _cache_lock
+        self._search_cache = OrderedDict()
+    
+    @staticmethod
+    def parse_cargurus_url(url: str) -> Tuple[bool, Optional[str]]:
+        """
+        Validate a CarGurus URL and extract its listing ID (both steps are memoized per URL).
+        
+        Args:
+            url: CarGurus.com URL to parse
+            
+        Returns:
+            (is_valid, listing_id) tuple; listing_id is None for invalid URLs or
+            when no listing ID can be found
+        """
+        if not CarGurusScraper._is_valid_cargurus_url(url):
+            return False, None
+        return True, CarGurusScraper._extract_listing_id(url)
     
     def scrape_car(self, url: str) -> Optional[ScrapedCar]:
         """
         Main scraping method using CarGurus JSON API.
         
+        Validates the URL and extracts its listing ID, then scrapes through
+        scrape_car_by_id.
+        
         Args:
             url: CarGurus.com URL to scrape
             
         Returns:
             ScrapedCar object if successful, None otherwise
         """
-        start_time = time.time()
+        is_valid, listing_id = self.parse_cargurus_url(url)
+        if not is_valid:
+            logger.error("Invalid CarGurus URL: %s", url)
+            return None
+        if not listing_id:
+            logger.error("Could not extract listing ID from URL: %s", url)
+            logger.info("URL analysis - Domain: %s, Path: %s", urlparse(url).netloc, urlparse(url).path)
+            return None
+        return self.scrape_car_by_id(listing_id, url)
+    
+    def scrape_car_by_id(self, listing_id: str, url: str) -> Optional[ScrapedCar]:
+        """
+        Scrape a car by listing ID for callers that have already parsed the URL.
         
-        try:
-            logger.info(f"Starting scrape for URL: {url}")
+        Successful scrapes are cached by listing ID for _SCRAPE_CACHE_TTL seconds, so
+        different URLs for the same listing share an entry. Concurrent requests for the
+        same listing wait for a single in-flight scrape instead of each hitting CarGurus.
+        
+        Args:
+            listing_id: CarGurus listing ID (see parse_cargurus_url)
+            url: CarGurus.com URL the listing was requested with, used as originalUrl
             
-            # Validate URL
-            if not self._is_valid_cargurus_url(url):
-                logger.error(f"Invalid CarGurus URL: {url}")
+        Returns:
+            ScrapedCar object if successful, None otherwise
+        """
+        key = listing_id
+        car = self._get_cached_car(key)
+        if car is not None:
+            logger.info("Serving cached scrape for URL: %s", url)
+            return self._with_original_url(car, url)
+        
+        with self._cache_lock:
+            url_lock = self._url_locks.setdefault(key, threading.Lock())
+        try:
+            with url_lock:
+                # Another request may have finished the same scrape while this one waited
+                car = self._get_cached_car(key)
+                if car is None:
+                    car = self._scrape_car_uncached(listing_id, url)
+                    if car is not None:
+                        self._store_cached_car(key, car)
+                return self._with_original_url(car, url) if car is not None else None
+        finally:
+            with self._cache_lock:
+                if self._url_locks.get(key) is url_lock:
+                    del self._url_locks[key]
+    
+    def _with_original_url(self, car: ScrapedCar, url: str) -> ScrapedCar:
+        """Return the cached car as scraped from url (another URL for the listing may have filled the cache)"""
+        if car.originalUrl == url:
+            return car
+        return car.model_copy(update={'originalUrl': url})
+    
+    def _get_cached_car(self, key: str) -> Optional[ScrapedCar]:
+        """Return the cached car for a listing ID/URL key if it hasn't expired"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
                 return None
-            
-            # Extract listing ID from URL
-            listing_id = self._extract_listing_id(url)
-            if not listing_id:
-                logger.error(f"Could not extract listing ID from URL: {url}")
-                logger.info(f"URL analysis - Domain: {urlparse(url).netloc}, Path: {urlparse(url).path}")
+            if entry[0] < time.monotonic():
+                del self._cache[key]
                 return None
-            
-            logger.info(f"Extracted listing ID: {listing_id}")
+            self._cache.move_to_end(key)
+            return entry[1]
+    
+    def _store_cached_car(self, key: str, car: ScrapedCar) -> None:
+        """Cache a scraped car, evicting the least recently used entry when full"""
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + _SCRAPE_CACHE_TTL, car)
+            self._cache.move_to_end(key)
+            if len(self._cache) > _SCRAPE_CACHE_MAXSIZE:
+                self._cache.popitem(last=False)
+    
+    def _scrape_car_uncached(self, listing_id: str, url: str) -> Optional[ScrapedCar]:
+        """Fetch and extract a car from CarGurus, bypassing the scrape cache"""
+        start_time = time.time()
+        
+        try:
+            logger.info("Starting scrape for listing ID %s (URL: %s)", listing_id, url)
             
             # Fetch JSON data from CarGurus API
             json_data = self._fetch_json_data(listing_id)
             if not json_data:
-                logger.error(f"Failed to fetch JSON data for listing ID: {listing_id}")
+                logger.error("Failed to fetch JSON data for listing ID: %s", listing_id)
                 return None
             
             # Extract car data from JSON
@@ -76,33 +656,69 @@ class CarGurusScraper:
             
             if car_data:
                 processingTime = time.time() - start_time
-                logger.info(f"Successfully scraped car in {processingTime:.2f}s: {car_data.make} {car_data.model} {car_data.year}")
-                return car_data
+                logger.info("Successfully scraped car in %.2fs: %s %s %s", processingTime, car_data.make, car_data.model, car_data.year)
+                return car_data.to_model()
             else:
-                logger.warning(f"Failed to extract car data from JSON for listing ID: {listing_id}")
+                logger.warning("Failed to extract car data from JSON for listing ID: %s", listing_id)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
+            logger.error("Error scraping %s: %s", url, e)
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: %s", traceback.format_exc())
             return None
 
     def search_inventory(self, request: InventorySearchRequest) -> InventorySearchResult:
         """
         Search for cars in CarGurus inventory based on search parameters.
         
+        Results are cached per (zip, distance, page, srpVariation, newUsed) for
+        _SEARCH_CACHE_TTL seconds, or _SEARCH_CACHE_ERROR_TTL when the search failed.
+        
         Args:
             request: InventorySearchRequest containing search parameters
             
         Returns:
             InventorySearchResult with list of cars and pagination info
         """
+        key = (request.zip, request.distance, request.pageNumber, request.srpVariation, request.newUsed)
+        result = self._get_cached_search(key)
+        if result is not None:
+            logger.info("Serving cached inventory search: %s", key)
+            return result
+        
+        result = self._search_inventory_uncached(request)
+        self._store_cached_search(key, result)
+        return result
+    
+    def _get_cached_search(self, key: tuple) -> Optional[InventorySearchResult]:
+        """Return the cached search result for a key if it hasn't expired"""
+        with self._cache_lock:
+            entry = self._search_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._search_cache[key]
+                return None
+            self._search_cache.move_to_end(key)
+            return entry[1]
+    
+    def _store_cached_search(self, key: tuple, result: InventorySearchResult) -> None:
+        """Cache a search result, evicting the least recently used entry when full"""
+        ttl = _SEARCH_CACHE_ERROR_TTL if result.errorMessage else _SEARCH_CACHE_TTL
+        with self._cache_lock:
+            self._search_cache[key] = (time.monotonic() + ttl, result)
+            self._search_cache.move_to_end(key)
+            if len(self._search_cache) > _SEARCH_CACHE_MAXSIZE:
+                self._search_cache.popitem(last=False)
+    
+    def _search_inventory_uncached(self, request: InventorySearchRequest) -> InventorySearchResult:
+        """Run an inventory search against CarGurus, bypassing the search cache"""
         start_time = time.time()
         
         try:
-            logger.info(f"=== STARTING INVENTORY SEARCH ===")
-            logger.info(f"Request parameters: ZIP={request.zip}, Distance={request.distance}, Page={request.pageNumber}, srpVariation={request.srpVariation}, newUsed={request.newUsed}")
+            logger.info("=== STARTING INVENTORY SEARCH ===")
+            logger.info("Request parameters: ZIP=%s, Distance=%s, Page=%s, srpVariation=%s, newUsed=%s", request.zip, request.distance, request.pageNumber, request.srpVariation, request.newUsed)
             
             # Construct the search URL
             search_url = "https://www.cargurus.com/Cars/searchPage.action"
@@ -132,39 +748,20 @@ class CarGurusScraper:
                 # but we can add it later if needed for multi-page consistency
                 pass
             
-            logger.info(f"CarGurus search URL: {search_url} with params: {params}")
-            
-            # Update session headers to match the successful curl command
-            self.session.headers.update({
-                'accept': '*/*',
-                'accept-language': 'en-US,en;q=0.9',
-                'cache-control': 'no-cache',
-                'dnt': '1',
-                'pragma': 'no-cache',
-                'priority': 'u=1, i',
-                'sec-ch-device-memory': '8',
-                'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-                'sec-ch-ua-arch': '"x86"',
-                'sec-ch-ua-full-version-list': '"Not)A;Brand";v="8.0.0.0", "Chromium";v="138.0.7204.188", "Google Chrome";v="138.0.7204.188"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-model': '""',
-                'sec-ch-ua-platform': '"Windows"',
-                'sec-fetch-dest': 'empty',
-                'sec-fetch-mode': 'cors',
-                'sec-fetch-site': 'same-origin',
-                'x-cg-client-id': 'site-cars',
-                'x-requested-with': 'XMLHttpRequest'
-            })
+            logger.info("CarGurus search URL: %s with params: %s", search_url, params)
+            
+            # Search requests carry the headers of the successful curl command (per request,
+            # since concurrent scrapes share this session)
             
             logger.info("Attempting search with enhanced parameters and headers for consistency")
             
             for attempt in range(self.max_retries):
                 try:
-                    response = self.session.get(search_url, params=params, timeout=self.timeout)
+                    response = self.session.get(search_url, params=params, headers=_SEARCH_HEADERS, timeout=self.timeout)
                     
-                    logger.info(f"Response status: {response.status_code}")
-                    logger.info(f"Content-Type: {response.headers.get('content-type', 'unknown')}")
-                    logger.info(f"Content length: {len(response.text)} characters")
+                    logger.info("Response status: %s", response.status_code)
+                    logger.info("Content-Type: %s", response.headers.get('content-type', 'unknown'))
+                    logger.info("Content length: %s bytes", len(response.content))
                     
                     if response.status_code == 200:
                         content_type = response.headers.get('content-type', '').lower()
@@ -174,15 +771,15 @@ class CarGurusScraper:
                             logger.info("Detected JSON response from CarGurus")
                             
                             try:
-                                json_data = response.json()
-                                logger.info(f"JSON response keys: {list(json_data.keys()) if isinstance(json_data, dict) else 'Not a dict'}")
+                                json_data = _json_loads(response.content)
+                                logger.info("JSON response keys: %s", list(json_data.keys()) if isinstance(json_data, dict) else 'Not a dict')
                                 
                                 # Extract cars from JSON response
                                 cars = self._extract_cars_from_json_response(json_data)
                                 
                                 if cars:
                                     processing_time = time.time() - start_time
-                                    logger.info(f"Successfully found {len(cars)} cars in {processing_time:.2f}s")
+                                    logger.info("Successfully found %s cars in %.2fs", len(cars), processing_time)
                                     
                                     # Estimate total results and pages (CarGurus typically shows 20 cars per page)
                                     total_results = len(cars) * 20  # Rough estimate
@@ -190,7 +787,7 @@ class CarGurusScraper:
                                     
                                     return InventorySearchResult(
                                         success=True,
-                                        cars=cars,
+                                        cars=[car.to_model() for car in cars],
                                         totalResults=total_results,
                                         currentPage=request.pageNumber,
                                         totalPages=total_pages,
@@ -204,8 +801,8 @@ class CarGurusScraper:
                                         processingTime=time.time() - start_time
                                     )
                                     
-                            except json.JSONDecodeError as e:
-                                logger.error(f"Failed to parse JSON response: {e}")
+                            except _JSON_DECODE_ERRORS as e:
+                                logger.error("Failed to parse JSON response: %s", e)
                                 return InventorySearchResult(
                                     success=False,
                                     errorMessage=f"Failed to parse JSON response: {e}",
@@ -219,7 +816,7 @@ class CarGurusScraper:
                             
                             if cars:
                                 processing_time = time.time() - start_time
-                                logger.info(f"Successfully found {len(cars)} cars in {processing_time:.2f}s")
+                                logger.info("Successfully found %s cars in %.2fs", len(cars), processing_time)
                                 
                                 # Estimate total results and pages (CarGurus typically shows 20 cars per page)
                                 total_results = len(cars) * 20  # Rough estimate
@@ -241,13 +838,13 @@ class CarGurusScraper:
                                     processingTime=time.time() - start_time
                                 )
                     else:
-                        logger.warning(f"HTTP {response.status_code} for search (attempt {attempt + 1})")
-                        logger.warning(f"Response content preview: {response.text[:500]}...")
+                        logger.warning("HTTP %s for search (attempt %s)", response.status_code, attempt + 1)
+                        logger.warning("Response content preview: %s...", response.text[:500])
                         
                 except requests.Timeout:
-                    logger.warning(f"Timeout for search (attempt {attempt + 1})")
+                    logger.warning("Timeout for search (attempt %s)", attempt + 1)
                 except Exception as e:
-                    logger.error(f"Error during search (attempt {attempt + 1}): {str(e)}")
+                    logger.error("Error during search (attempt %s): %s", attempt + 1, e)
                 
                 if attempt < self.max_retries - 1:
                     time.sleep(2 ** attempt)  # Exponential backoff
@@ -259,9 +856,9 @@ class CarGurusScraper:
             )
             
         except Exception as e:
-            logger.error(f"Error in search_inventory: {str(e)}")
+            logger.error("Error in search_inventory: %s", e)
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: %s", traceback.format_exc())
             return InventorySearchResult(
                 success=False,
                 errorMessage=f"Internal error: {str(e)}",
@@ -285,18 +882,18 @@ class CarGurusScraper:
         start_time = time.time()
         
         try:
-            logger.info(f"=== STARTING DEALER PAGE SCRAPE (AJAX METHOD) ===")
-            logger.info(f"Dealer Entity ID: {dealer_entity_id}, Dealer URL: {dealer_url}, Page: {page_number}, Inventory Type: {inventory_type}")
+            logger.info("=== STARTING DEALER PAGE SCRAPE (AJAX METHOD) ===")
+            logger.info("Dealer Entity ID: %s, Dealer URL: %s, Page: %s, Inventory Type: %s", dealer_entity_id, dealer_url, page_number, inventory_type)
             
             # Use the provided dealer URL instead of hard-coding
-            logger.info(f"Getting initial dealer page: {dealer_url}")
+            logger.info("Getting initial dealer page: %s", dealer_url)
             
             # Get the initial page to extract search parameters
             response = self.session.get(dealer_url, timeout=self.timeout)
             
             direct_fallback = False
             if response.status_code != 200:
-                logger.error(f"Failed to get initial dealer page: HTTP {response.status_code}")
+                logger.error("Failed to get initial dealer page: HTTP %s", response.status_code)
                 # Do NOT return early. Fall back to a direct AJAX request with synthesized params.
                 direct_fallback = True
             
@@ -336,39 +933,20 @@ class CarGurusScraper:
             # Now make the AJAX request to get the specific page
             ajax_url = "https://www.cargurus.com/Cars/searchPage.action"
             
-            # Update headers for AJAX request
-            self.session.headers.update({
-                'accept': '*/*',
-                'accept-language': 'en-US,en;q=0.9',
-                'cache-control': 'no-cache',
-                'pragma': 'no-cache',
-                'sec-ch-device-memory': '8',
-                'sec-ch-ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-                'sec-ch-ua-arch': '"x86"',
-                'sec-ch-ua-full-version-list': '"Not)A;Brand";v="8.0.0.0", "Chromium";v="138.0.7204.188", "Google Chrome";v="138.0.7204.188"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-model': '""',
-                'sec-ch-ua-platform': '"Windows"',
-                'sec-fetch-dest': 'empty',
-                'sec-fetch-mode': 'cors',
-                'sec-fetch-site': 'same-origin',
-                'x-cg-client-id': 'site-cars',
-                'x-requested-with': 'XMLHttpRequest',
-                'referer': dealer_url,
-                'origin': 'https://www.cargurus.com',
-            })
+            # Headers for the AJAX request (per request, since concurrent scrapes share this session)
+            ajax_headers = {**_DEALER_AJAX_HEADERS, 'referer': dealer_url}
             
             # Update search parameters for the specific page
             search_params['pageNumber'] = page_number
             
-            logger.info(f"Making AJAX request to: {ajax_url}")
-            logger.info(f"Parameters: {search_params}")
+            logger.info("Making AJAX request to: %s", ajax_url)
+            logger.info("Parameters: %s", search_params)
             
             # Make the AJAX request
-            ajax_response = self.session.get(ajax_url, params=search_params, timeout=self.timeout)
+            ajax_response = self.session.get(ajax_url, params=search_params, headers=ajax_headers, timeout=self.timeout)
             
             if ajax_response.status_code != 200:
-                logger.error(f"AJAX request failed: HTTP {ajax_response.status_code}")
+                logger.error("AJAX request failed: HTTP %s", ajax_response.status_code)
                 return InventorySearchResult(
                     success=False,
                     cars=[],
@@ -380,15 +958,19 @@ class CarGurusScraper:
                     message=f"AJAX request failed: HTTP {ajax_response.status_code}"
                 )
             
+            # Decode the AJAX payload once from the raw bytes; the car and total extractors share it
+            ajax_content = ajax_response.content
+            ajax_json = _decode_json_payload(ajax_content)
+            
             # Extract cars from the AJAX response
-            cars = self._extract_cars_from_ajax_response(ajax_response.text, dealer_entity_id)
+            cars = self._extract_cars_from_ajax_response(ajax_content, dealer_entity_id, ajax_json)
             
             if cars:
                 processing_time = time.time() - start_time
-                logger.info(f"Successfully found {len(cars)} cars from AJAX response in {processing_time:.2f}s")
+                logger.info("Successfully found %s cars from AJAX response in %.2fs", len(cars), processing_time)
                 
                 # Get the total number of cars from the AJAX response (filtered total)
-                total_cars = self._extract_total_cars_from_ajax_response(ajax_response.text)
+                total_cars = self._extract_total_cars_from_ajax_response(ajax_content, ajax_json)
                 
                 if total_cars > 0:
                     # Use the actual total cars for accurate pagination
@@ -397,9 +979,9 @@ class CarGurusScraper:
                     total_pages = max(1, (total_cars + cars_per_page - 1) // cars_per_page)
                     has_next_page = page_number < total_pages
                     
-                    logger.info(f"Total cars from dealer page: {total_cars}")
-                    logger.info(f"Calculated total pages: {total_pages}")
-                    logger.info(f"Has next page: {has_next_page}")
+                    logger.info("Total cars from dealer page: %s", total_cars)
+                    logger.info("Calculated total pages: %s", total_pages)
+                    logger.info("Has next page: %s", has_next_page)
                     
                     return InventorySearchResult(
                         success=True,
@@ -444,7 +1026,7 @@ class CarGurusScraper:
                 )
                         
         except Exception as e:
-            logger.error(f"Unexpected error in dealer page scrape: {e}")
+            logger.error("Unexpected error in dealer page scrape: %s", e)
             import traceback
             traceback.print_exc()
             return InventorySearchResult(
@@ -474,29 +1056,25 @@ class CarGurusScraper:
         try:
             # Use regex to find car listings in the HTML
             # Look for patterns that indicate car listings
-            import re
-
-            print(html_content)
+            logger.debug("Search page HTML (%s chars)", len(html_content))
             
-            # Pattern to find car listing URLs
-            listing_pattern = r'href="([^"]*inventorylisting[^"]*)"'
-            listing_matches = re.findall(listing_pattern, html_content)
+            # Find car listing URLs
+            listing_matches = _INVENTORY_LISTING_HREF_RE.findall(html_content)
             
             # Also look for JSON data embedded in the page
-            json_pattern = r'window\.__INITIAL_STATE__\s*=\s*({.*?});'
-            json_match = re.search(json_pattern, html_content, re.DOTALL)
+            json_match = _INITIAL_STATE_RE.search(html_content)
             
             if json_match:
                 try:
-                    json_data = json.loads(json_match.group(1))
+                    json_data = _json_loads(json_match.group(1))
                     # Extract car data from JSON if available
                     cars.extend(self._extract_cars_from_json_data(json_data))
-                except json.JSONDecodeError:
+                except _JSON_DECODE_ERRORS:
                     logger.warning("Failed to parse embedded JSON data")
             
             # If no cars found from JSON, try to extract from listing URLs
             if not cars and listing_matches:
-                logger.info(f"Found {len(listing_matches)} potential listing URLs")
+                logger.info("Found %s potential listing URLs", len(listing_matches))
                 
                 # Limit to first 10 listings to avoid overwhelming the system
                 for i, listing_url in enumerate(listing_matches[:10]):
@@ -509,20 +1087,20 @@ class CarGurusScraper:
                         car = self.scrape_car(listing_url)
                         if car:
                             cars.append(car)
-                            logger.info(f"Successfully scraped car {i+1}: {car.fullTitle}")
+                            logger.info("Successfully scraped car %s: %s", i+1, car.fullTitle)
                         
                         # Add delay between requests to be respectful
                         time.sleep(1)
                         
                     except Exception as e:
-                        logger.warning(f"Failed to scrape car from {listing_url}: {str(e)}")
+                        logger.warning("Failed to scrape car from %s: %s", listing_url, e)
                         continue
             
-            logger.info(f"Extracted {len(cars)} cars from search page")
+            logger.info("Extracted %s cars from search page", len(cars))
             return cars
             
         except Exception as e:
-            logger.error(f"Error extracting cars from search page: {str(e)}")
+            logger.error("Error extracting cars from search page: %s", e)
             return cars
 
     def _extract_cars_from_json_data(self, json_data: dict) -> List[ScrapedCar]:
@@ -568,13 +1146,13 @@ class CarGurusScraper:
                         if car:
                             cars.append(car)
                     except Exception as e:
-                        logger.warning(f"Failed to extract car from listing JSON: {str(e)}")
+                        logger.warning("Failed to extract car from listing JSON: %s", e)
                         continue
             
             return cars
             
         except Exception as e:
-            logger.error(f"Error extracting cars from JSON data: {str(e)}")
+            logger.error("Error extracting cars from JSON data: %s", e)
             return cars
 
     def _extract_car_from_listing_json(self, listing: dict) -> Optional[ScrapedCar]:
@@ -638,15 +1216,17 @@ class CarGurusScraper:
             )
             
         except Exception as e:
-            logger.warning(f"Error extracting car from listing JSON: {str(e)}")
+            logger.warning("Error extracting car from listing JSON: %s", e)
             return None
     
-    def _is_valid_cargurus_url(self, url: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=_URL_PARSE_CACHE_SIZE)
+    def _is_valid_cargurus_url(url: str) -> bool:
         """Validate that the URL is a valid CarGurus.com URL"""
         try:
             parsed = urlparse(url)
-            # Check if it's a CarGurus domain
-            if parsed.netloc not in ('www.cargurus.com', 'cargurus.com'):
+            # Check if it's an https CarGurus URL
+            if parsed.scheme != 'https' or parsed.netloc not in ('www.cargurus.com', 'cargurus.com'):
                 return False
             
             # Check if it's a car-related page (more flexible)
@@ -663,91 +1243,40 @@ class CarGurusScraper:
         except Exception:
             return False
     
-    def _extract_listing_id(self, url: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=_URL_PARSE_CACHE_SIZE)
+    def _extract_listing_id(url: str) -> Optional[str]:
         """Extract listing ID from CarGurus URL using multiple patterns"""
         try:
-            # Pattern 1: listingId parameter (e.g., ?listingId=123456789)
-            if 'listingId=' in url:
-                start = url.find('listingId=') + len('listingId=')
-                end = url.find('&', start)
-                if end == -1:
-                    end = url.find('#', start)
-                if end == -1:
-                    end = len(url)
-                listing_id = url[start:end]
-                if listing_id.isdigit():
-                    return listing_id
-            
-            # Pattern 2: /listing=ID/ format (e.g., #listing=123456789/NONE/DEFAULT)
-            if '/listing=' in url:
-                start = url.find('/listing=') + len('/listing=')
-                end = url.find('/', start)
-                if end == -1:
-                    end = len(url)
-                listing_part = url[start:end]
-                # Extract just the ID part before any slashes
-                listing_id = listing_part.split('/')[0]
-                if listing_id.isdigit():
-                    return listing_id
-            
-            # Pattern 3: #listing=ID format (e.g., #listing=123456789/NONE/DEFAULT)
-            if '#listing=' in url:
-                start = url.find('#listing=') + len('#listing=')
-                end = url.find('/', start)
-                if end == -1:
-                    end = len(url)
-                listing_part = url[start:end]
-                # Extract just the ID part before any slashes
-                listing_id = listing_part.split('/')[0]
-                if listing_id.isdigit():
-                    return listing_id
-            
-            # Pattern 4: Extract from URL path (e.g., /Cars/l-123456789)
-            # Look for patterns like /l-123456789 or similar
-            import re
-            path_patterns = [
-                r'/l-(\d+)',  # /l-123456789
-                r'/listing/(\d+)',  # /listing/123456789
-                r'/inventorylisting/(\d+)',  # /inventorylisting/123456789
-            ]
-            
-            for pattern in path_patterns:
-                match = re.search(pattern, url)
-                if match:
-                    listing_id = match.group(1)
+            # Patterns 1-3: listingId=ID, /listing=ID/ and #listing=ID/ markers
+            for marker, parse in _LISTING_ID_MARKERS:
+                if marker in url:
+                    listing_id = parse(url)
                     if listing_id.isdigit():
                         return listing_id
             
+            # Pattern 4: Extract from URL path (e.g., /Cars/l-123456789)
             # Pattern 5: Extract from query parameters (various formats)
-            query_patterns = [
-                r'[?&]id=(\d+)',
-                r'[?&]listing=(\d+)',
-                r'[?&]inventoryId=(\d+)',
-            ]
-            
-            for pattern in query_patterns:
-                match = re.search(pattern, url)
+            for pattern in _LISTING_ID_PATH_RES + _LISTING_ID_QUERY_RES:
+                match = pattern.search(url)
                 if match:
-                    listing_id = match.group(1)
-                    if listing_id.isdigit():
-                        return listing_id
+                    return match.group(1)
             
             # Pattern 6: Look for any sequence of 6+ digits that might be a listing ID
-            digit_pattern = r'(\d{6,})'
-            matches = re.findall(digit_pattern, url)
-            for match in matches:
+            for match in _LISTING_ID_DIGITS_RE.findall(url):
                 # Check if this looks like a listing ID (not a zip code, year, etc.)
-                if len(match) >= 6 and not self._is_likely_not_listing_id(match, url):
+                if not CarGurusScraper._is_likely_not_listing_id(match, url):
                     return match
             
-            logger.warning(f"Could not extract listing ID from URL: {url}")
+            logger.warning("Could not extract listing ID from URL: %s", url)
             return None
             
         except Exception as e:
-            logger.error(f"Error extracting listing ID from {url}: {str(e)}")
+            logger.error("Error extracting listing ID from %s: %s", url, e)
             return None
     
-    def _is_likely_not_listing_id(self, candidate: str, url: str) -> bool:
+    @staticmethod
+    def _is_likely_not_listing_id(candidate: str, url: str) -> bool:
         """Check if a candidate ID is likely not a listing ID"""
         # Years are not listing IDs
         if len(candidate) == 4 and 1900 <= int(candidate) <= 2030:
@@ -790,28 +1319,28 @@ class CarGurusScraper:
                 response = self.session.get(api_url, params=params, timeout=self.timeout)
                 if response.status_code == 200:
                     try:
-                        json_data = response.json()
+                        json_data = _json_loads(response.content)
                         if 'listing' in json_data:
-                            logger.info(f"Successfully fetched JSON data for listing {listing_id}")
+                            logger.info("Successfully fetched JSON data for listing %s", listing_id)
                             return json_data
                         else:
-                            logger.warning(f"Invalid JSON response structure for listing {listing_id}")
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON for listing {listing_id}: {str(e)}")
+                            logger.warning("Invalid JSON response structure for listing %s", listing_id)
+                    except _JSON_DECODE_ERRORS as e:
+                        logger.warning("Failed to parse JSON for listing %s: %s", listing_id, e)
                 else:
-                    logger.warning(f"HTTP {response.status_code} for listing {listing_id} (attempt {attempt + 1})")
+                    logger.warning("HTTP %s for listing %s (attempt %s)", response.status_code, listing_id, attempt + 1)
                     
             except requests.Timeout:
-                logger.warning(f"Timeout for listing {listing_id} (attempt {attempt + 1})")
+                logger.warning("Timeout for listing %s (attempt %s)", listing_id, attempt + 1)
             except Exception as e:
-                logger.error(f"Error fetching listing {listing_id} (attempt {attempt + 1}): {str(e)}")
+                logger.error("Error fetching listing %s (attempt %s): %s", listing_id, attempt + 1, e)
             
             if attempt < self.max_retries - 1:
                 time.sleep(2 ** attempt)  # Exponential backoff
         
         return None
     
-    def _extract_car_data_from_json(self, json_data: dict, url: str) -> Optional[ScrapedCar]:
+    def _extract_car_data_from_json(self, json_data: dict, url: str) -> Optional[ScrapedCarRow]:
         """
         Extract car data from CarGurus JSON response.
         
@@ -820,7 +1349,7 @@ class CarGurusScraper:
             url: Original URL
             
         Returns:
-            ScrapedCar object if successful, None otherwise
+            ScrapedCarRow if successful, None otherwise
         """
         try:
             listing = json_data.get('listing', {})
@@ -831,19 +1360,25 @@ class CarGurusScraper:
             if not auto_entity_info:
                 auto_entity_info = listing.get('autoEntityInfo', {})
             
-            # Extract year, make, model, and trim from autoEntityInfo
-            year = auto_entity_info.get('year', listing.get('year', 0))
-            make = auto_entity_info.get('make', listing.get('makeName', 'Unknown'))
-            model = auto_entity_info.get('model', listing.get('modelName', 'Unknown'))
+            (listing_year, make_name, model_name, listing_title, trim_name,
+             price, description, exterior_color, interior_color) = _LISTING_GET({**_LISTING_DEFAULTS, **listing})
+            
+            # Extract year, make, model, and trim from autoEntityInfo, falling back to the listing
+            auto_defaults = {
+                'year': listing_year,
+                'make': make_name,
+                # Only a missing modelName means 'Unknown'; an explicit null still fails the check below
+                'model': listing.get('modelName', 'Unknown'),
+                'trim': '',
+                'bodyStyle': '',
+            }
+            year, make, model, trim, body_style = _AUTO_ENTITY_GET({**auto_defaults, **auto_entity_info})
             
             # Try to get trim from multiple sources
-            trim = auto_entity_info.get('trim', '')
             if not trim or trim.strip() == '':
                 # Try to extract from listingTitleOnly first (most complete)
-                listing_title = listing.get('listingTitleOnly', '')
                 if listing_title:
                     # Extract the part after the model name
-                    model_name = listing.get('modelName', '')
                     if model_name and model_name in listing_title:
                         # Find the part after the model name
                         parts = listing_title.split(model_name, 1)
@@ -853,7 +1388,7 @@ class CarGurusScraper:
                                 trim = potential_trim
             if not trim or trim.strip() == '':
                 # Fallback to trimName from listing
-                trim = listing.get('trimName', '')
+                trim = trim_name
             
             # Construct the full title: Year Make Model Trim
             if trim and trim.strip():
@@ -861,9 +1396,6 @@ class CarGurusScraper:
             else:
                 fullTitle = f"{year} {make} {model}".strip()
             
-            price = listing.get('price', 0.0)
-            description = listing.get('description', 'No description available.')
-            
             # Extract features from options and description
             features = self._extract_features_from_json(listing)
             
@@ -873,20 +1405,15 @@ class CarGurusScraper:
             # Extract all images
             images = self._extract_images_from_json(listing)
             
-            # Extract vehicle appearance details
-            exterior_color = listing.get('localizedExteriorColor', '')
-            interior_color = listing.get('localizedInteriorColor', '')
-            body_style = auto_entity_info.get('bodyStyle', '')
-            
             # Validate that we have at least basic information
             if not make or not model or year == 0:
-                logger.warning(f"Insufficient car data extracted from JSON")
+                logger.warning("Insufficient car data extracted from JSON")
                 return None
             
-            logger.info(f"Extracted car title: {fullTitle}")
-            logger.info(f"Extracted colors - Exterior: {exterior_color}, Interior: {interior_color}, Body Style: {body_style}")
+            logger.info("Extracted car title: %s", fullTitle)
+            logger.info("Extracted colors - Exterior: %s, Interior: %s, Body Style: %s", exterior_color, interior_color, body_style)
             
-            return ScrapedCar(
+            return ScrapedCarRow(
                 make=make,
                 model=model,
                 year=year,
@@ -903,7 +1430,7 @@ class CarGurusScraper:
             )
             
         except Exception as e:
-            logger.error(f"Error extracting car data from JSON: {str(e)}")
+            logger.error("Error extracting car data from JSON: %s", e)
             return None
     
     def _extract_features_from_json(self, listing: dict) -> List[str]:
@@ -967,7 +1494,7 @@ class CarGurusScraper:
                 # Add category header if it has items
                 if items and category_name:
                     stats.append({
-                        'header': f"📋 {category_name}",
+                        'header': _STATS_CATEGORY_PREFIX + category_name,
                         'value': f"{len(items)} items"
                     })
                 
@@ -996,14 +1523,14 @@ class CarGurusScraper:
                     option_names = [opt.get('name', '') for opt in options_list if isinstance(opt, dict) and opt.get('name')]
                     if option_names:
                         stats.append({
-                            'header': f"🔧 {category_name} Options",
+                            'header': _STATS_OPTIONS_PREFIX + category_name + _STATS_OPTIONS_SUFFIX,
                             'value': f"{len(option_names)} options"
                         })
                         # Add individual options
                         for option_name in option_names:
                             stats.append({
-                                'header': "  • " + option_name,
-                                'value': "✓"
+                                'header': _STATS_OPTION_BULLET + option_name,
+                                'value': _STATS_OPTION_CHECK
                             })
             
             # Add MPG values as separate stats for easy access in stage2 workflow
@@ -1019,10 +1546,10 @@ class CarGurusScraper:
                     'value': highway_mpg
                 })
             
-            logger.info(f"Extracted {len(stats)} stats from listing (City MPG: {city_mpg}, Highway MPG: {highway_mpg})")
+            logger.info("Extracted %s stats from listing (City MPG: %s, Highway MPG: %s)", len(stats), city_mpg, highway_mpg)
             
         except Exception as e:
-            logger.warning(f"Error extracting stats: {str(e)}")
+            logger.warning("Error extracting stats: %s", e)
             # Return empty list if there's an error
             stats = []
         
@@ -1036,16 +1563,17 @@ class CarGurusScraper:
         for picture in pictures:
             # Use the main URL (1024x768) for best quality
             url = picture.get('url')
-            if url and url not in images:
+            if url:
                 images.append(url)
+        images = list(dict.fromkeys(images))
         
         # If no images found, add placeholder
         if not images:
-            images.append("https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop")
+            images.append(_PLACEHOLDER_IMG)
         
         return images 
 
-    def _extract_cars_from_json_response(self, json_data: dict) -> List[ScrapedCar]:
+    def _extract_cars_from_json_response(self, json_data: dict) -> List[ScrapedCarRow]:
         """
         Extract car listings from JSON response from CarGurus.
         
@@ -1053,7 +1581,7 @@ class CarGurusScraper:
             json_data: JSON data from the CarGurus search response
             
         Returns:
-            List of ScrapedCar objects
+            List of ScrapedCarRow objects
         """
         cars = []
         
@@ -1066,180 +1594,75 @@ class CarGurusScraper:
                 return cars
             
             tiles = json_data['tiles']
-            logger.info(f"Found {len(tiles)} tiles in JSON response")
+            logger.info("Found %s tiles in JSON response", len(tiles))
+            # One timestamp for the whole response rather than one per tile
+            scraped_at = datetime.now()
             
             for i, tile in enumerate(tiles):
                 try:
-                    logger.info(f"Processing tile {i+1}/{len(tiles)}")
+                    logger.info("Processing tile %s/%s", i + 1, len(tiles))
                     
                     # Check if this is a car listing tile
                     if not isinstance(tile, dict):
-                        logger.warning(f"Tile {i+1} is not a dict: {type(tile)}")
+                        logger.warning("Tile %s is not a dict: %s", i + 1, type(tile))
                         continue
                     
                     tile_type = tile.get('type', '')
                     tile_data = tile.get('data', {})
                     
-                    logger.info(f"Tile type: {tile_type}, has data: {bool(tile_data)}")
+                    logger.info("Tile type: %s, has data: %s", tile_type, bool(tile_data))
                     
                     # Look for car listing tiles using partial matching
                     is_listing_tile = False
                     matched_pattern = ""
                     
                     # Match any tile type that starts with LISTING_ and contains car data
-                    if re.match(r'LISTING_.*', tile_type):
+                    if _LISTING_TILE_RE.match(tile_type):
                         is_listing_tile = True
                         matched_pattern = "LISTING_.*"
-                        logger.info(f"DEBUG: Tile {i+1} matched LISTING_.* pattern")
+                        logger.debug("Tile %s matched LISTING_.* pattern", i + 1)
                     # Also check if it's a MERCH tile that might contain car data
                     elif tile_type == 'MERCH' and tile_data and any(key in tile_data for key in ['makeName', 'modelName', 'carYear']):
                         is_listing_tile = True
                         matched_pattern = "MERCH_WITH_CAR_DATA"
-                        logger.info(f"DEBUG: Tile {i+1} matched MERCH pattern")
+                        logger.debug("Tile %s matched MERCH pattern", i + 1)
                     
-                    logger.info(f"DEBUG: Tile {i+1} - is_listing_tile={is_listing_tile}, tile_data={bool(tile_data)}, tile_data_type={type(tile_data)}")
+                    logger.debug("Tile %s - is_listing_tile=%s, tile_data=%s, tile_data_type=%s", i + 1, is_listing_tile, bool(tile_data), type(tile_data))
                     
                     if is_listing_tile and tile_data:
-                        logger.info(f"Tile {i+1} matched pattern '{matched_pattern}' for type '{tile_type}'")
-                        car_data = self._extract_car_from_json_tile(tile_data)
+                        logger.info("Tile %s matched pattern '%s' for type '%s'", i + 1, matched_pattern, tile_type)
+                        car_data = self._extract_car_from_json_tile(tile_data, scraped_at)
                         if car_data:
                             cars.append(car_data)
-                            logger.info(f"Successfully extracted car: {car_data.make} {car_data.model} {car_data.year}")
+                            logger.info("Successfully extracted car: %s %s %s", car_data.make, car_data.model, car_data.year)
                         else:
-                            logger.warning(f"Failed to extract car data from tile {i+1}")
+                            logger.warning("Failed to extract car data from tile %s", i + 1)
                     else:
-                        logger.info(f"Skipping tile {i+1} - type: {tile_type}, is_listing_tile={is_listing_tile}, has_tile_data={bool(tile_data)}")
+                        logger.info("Skipping tile %s - type: %s, is_listing_tile=%s, has_tile_data=%s", i + 1, tile_type, is_listing_tile, bool(tile_data))
                         
                 except Exception as e:
-                    logger.warning(f"Error processing tile {i+1}: {e}")
+                    logger.warning("Error processing tile %s: %s", i + 1, e)
                     continue
             
-            logger.info(f"Successfully extracted {len(cars)} cars from JSON response")
+            logger.info("Successfully extracted %s cars from JSON response", len(cars))
             return cars
             
         except Exception as e:
-            logger.error(f"Error extracting cars from JSON response: {e}")
+            logger.error("Error extracting cars from JSON response: %s", e)
             return cars
     
-    def _extract_car_from_json_tile(self, tile_data: dict) -> Optional[ScrapedCar]:
+    def _extract_car_from_json_tile(self, tile_data: dict, scraped_at: Optional[datetime] = None) -> Optional[ScrapedCarRow]:
         """
-        Extract car data from a JSON tile.
+        Extract car data from a JSON tile (see _extract_car_from_json_tile_data).
         
         Args:
             tile_data: Data from a single tile
+            scraped_at: Timestamp shared by every tile of the response (now if omitted)
             
         Returns:
-            ScrapedCar object if successful, None otherwise
+            ScrapedCarRow if successful, None otherwise
         """
-        try:
-            logger.info("*** CALLING _extract_car_from_json_tile METHOD ***")
-            logger.info(f"Extracting car from tile data: {list(tile_data.keys())}")
-            
-            # Extract basic car information
-            make = tile_data.get('makeName', 'Unknown')
-            model = tile_data.get('modelName', 'Unknown')
-            year = tile_data.get('carYear', 2024)
-            price = tile_data.get('price', 0.0)
-            
-            # Extract title
-            title = tile_data.get('listingTitle', '')
-            if not title:
-                title = f"{year} {make} {model}"
-            
-            # Extract description
-            description = title
-            
-            # Extract features from options
-            features = tile_data.get('options', [])
-            
-            # Extract images - ENHANCED TO FIND ALL IMAGES
-            images = []
-            logger.info(f"=== EXTRACTING IMAGES FROM JSON TILE ===")
-            logger.info(f"Tile data keys: {list(tile_data.keys())}")
-            
-            # Method 1: Get primary image from originalPictureData
-            original_picture_data = tile_data.get('originalPictureData', {})
-            if original_picture_data and isinstance(original_picture_data, dict):
-                image_url = original_picture_data.get('url', '')
-                if image_url:
-                    images.append(image_url)
-                    logger.info(f"Found primary image: {image_url}")
-            
-            # Method 2: Look for additional images in other fields
-            image_fields = ['images', 'photos', 'pictureData', 'gallery', 'imageGallery', 'additionalImages']
-            for field in image_fields:
-                if field in tile_data:
-                    field_data = tile_data[field]
-                    logger.info(f"Found {field} field: {type(field_data)}")
-                    
-                    if isinstance(field_data, list):
-                        for i, item in enumerate(field_data):
-                            if isinstance(item, dict):
-                                for url_key in ['url', 'src', 'imageUrl', 'photoUrl']:
-                                    if url_key in item and item[url_key]:
-                                        if item[url_key] not in images:
-                                            images.append(item[url_key])
-                                            logger.info(f"Found additional image from {field}[{i}].{url_key}: {item[url_key]}")
-                            elif isinstance(item, str) and item not in images:
-                                images.append(item)
-                                logger.info(f"Found additional image from {field}[{i}]: {item}")
-                    elif isinstance(field_data, dict):
-                        for url_key in ['url', 'src', 'imageUrl', 'photoUrl']:
-                            if url_key in field_data and field_data[url_key]:
-                                if field_data[url_key] not in images:
-                                    images.append(field_data[url_key])
-                                    logger.info(f"Found additional image from {field}.{url_key}: {field_data[url_key]}")
-            
-            logger.info(f"Total images found: {len(images)}")
-            
-            # If no images found, add placeholder
-            if not images:
-                images.append("https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop")
-                logger.info("No images found, added placeholder")
-            
-            # Extract URL (construct from listing ID)
-            listing_id = tile_data.get('id', '')
-            original_url = f"https://www.cargurus.com/Cars/inventorylisting/vdp.action?listingId={listing_id}&entitySelectingHelper.selectedEntity=m6#listing={listing_id}/NONE/DEFAULT" if listing_id else "https://www.cargurus.com/Cars"
-            
-            # Extract additional info
-            mileage = tile_data.get('mileage', 0)
-            mileage_string = tile_data.get('mileageString', '0')
-            exterior_color = tile_data.get('exteriorColorName', 'Unknown')
-            dealer_name = tile_data.get('dealerName', 'Unknown')
-            seller_city = tile_data.get('sellerCity', '')
-            seller_region = tile_data.get('sellerRegion', '')
-            
-            # Create ScrapedCar object
-            logger.info(f"Creating ScrapedCar with: make={make}, model={model}, year={year}, price={price}")
-            logger.info(f"Features count: {len(features)}, Images count: {len(images)}")
-            
-            try:
-                car = ScrapedCar(
-                    make=make,
-                    model=model,
-                    year=year,
-                    price=price,
-                    description=description,
-                    features=features,
-                    images=images,
-                    originalUrl=original_url,
-                    fullTitle=title,
-                    scrapedAt=datetime.now()
-                )
-                
-                logger.info(f"Successfully created ScrapedCar object: {make} {model} {year} - ${price}")
-                return car
-                
-            except Exception as e:
-                logger.error(f"Failed to create ScrapedCar object: {e}")
-                logger.error(f"Data: make={make}, model={model}, year={year}, price={price}")
-                logger.error(f"Features: {features}")
-                logger.error(f"Images: {images}")
-                return None
-            
-        except Exception as e:
-            logger.warning(f"Error extracting car from JSON tile: {e}")
-            return None 
+        return _extract_car_from_json_tile_data(tile_data, scraped_at)
 
     def _extract_cars_from_dealer_page(self, html_content: str) -> List[ScrapedCar]:
         """
@@ -1249,31 +1672,32 @@ class CarGurusScraper:
         logger.info("=== EXTRACTING CARS FROM DEALER PAGE HTML ===")
         
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            # Parse only the listing containers rather than building the whole page tree
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=_LISTING_CONTAINER_STRAINER)
             cars = []
             
             # Look for car listing elements on the dealer page
             # These might be in different formats depending on the page structure
             
             # Method 1: Look for listing cards/containers
-            listing_containers = soup.find_all(['div', 'article'], class_=lambda x: x and any(keyword in x.lower() for keyword in ['listing', 'card', 'tile', 'car']))
+            listing_containers = soup.find_all(['div', 'article'], class_=_LISTING_CONTAINER_CLASS_RE)
             
             if listing_containers:
-                logger.info(f"=== METHOD 1: CONTAINER EXTRACTION ===")
-                logger.info(f"Found {len(listing_containers)} potential listing containers")
+                logger.info("=== METHOD 1: CONTAINER EXTRACTION ===")
+                logger.info("Found %s potential listing containers", len(listing_containers))
                 
                 for i, container in enumerate(listing_containers[:50]):  # Limit to first 50 for testing
                     try:
                         car = self._extract_car_from_dealer_listing_container(container)
                         if car:
                             cars.append(car)
-                            logger.info(f"Successfully extracted car {i+1}: {car.make} {car.model} {car.year} with {len(car.images)} images")
+                            logger.info("Successfully extracted car %s: %s %s %s with %s images", i+1, car.make, car.model, car.year, len(car.images))
                     except Exception as e:
-                        logger.warning(f"Error extracting car from container {i+1}: {e}")
+                        logger.warning("Error extracting car from container %s: %s", i+1, e)
                         continue
                 
                 if cars:
-                    logger.info(f"SUCCESS: Container extraction found {len(cars)} cars")
+                    logger.info("SUCCESS: Container extraction found %s cars", len(cars))
                 else:
                     logger.info("Container extraction found no cars")
             
@@ -1287,11 +1711,11 @@ class CarGurusScraper:
                 logger.info("=== METHOD 3: HTML PATTERN EXTRACTION ===")
                 cars = self._extract_cars_from_html_patterns(html_content)
             
-            logger.info(f"Successfully extracted {len(cars)} cars from dealer page HTML")
+            logger.info("Successfully extracted %s cars from dealer page HTML", len(cars))
             return cars
             
         except Exception as e:
-            logger.error(f"Error extracting cars from dealer page HTML: {e}")
+            logger.error("Error extracting cars from dealer page HTML: %s", e)
             return []
 
     def _extract_car_from_dealer_listing_container(self, container) -> Optional[ScrapedCar]:
@@ -1300,10 +1724,10 @@ class CarGurusScraper:
         """
         try:
             # Try to extract basic car information from the container
-            make_elem = container.find(['span', 'div', 'h3'], string=re.compile(r'\b[A-Z][a-z]+\b'))
-            model_elem = container.find(['span', 'div', 'h3'], string=re.compile(r'\b[A-Z][a-z0-9\s\-]+\b'))
-            year_elem = container.find(['span', 'div'], string=re.compile(r'\b(19|20)\d{2}\b'))
-            price_elem = container.find(['span', 'div'], string=re.compile(r'\$[\d,]+'))
+            make_elem = container.find(['span', 'div', 'h3'], string=_CONTAINER_MAKE_RE)
+            model_elem = container.find(['span', 'div', 'h3'], string=_CONTAINER_MODEL_RE)
+            year_elem = container.find(['span', 'div'], string=_CONTAINER_YEAR_RE)
+            price_elem = container.find(['span', 'div'], string=_PRICE_RE)
             
             if make_elem and model_elem and year_elem:
                 make = make_elem.get_text(strip=True)
@@ -1313,7 +1737,7 @@ class CarGurusScraper:
                 
                 if price_elem:
                     price_text = price_elem.get_text(strip=True)
-                    price_match = re.search(r'\$([\d,]+)', price_text)
+                    price_match = _PRICE_RE.search(price_text)
                     if price_match:
                         price = int(price_match.group(1).replace(',', ''))
                 
@@ -1339,7 +1763,7 @@ class CarGurusScraper:
                 return car
                 
         except Exception as e:
-            logger.warning(f"Error extracting car from container: {e}")
+            logger.warning("Error extracting car from container: %s", e)
             
         return None
 
@@ -1349,37 +1773,30 @@ class CarGurusScraper:
         """
         logger.info("=== ATTEMPTING EMBEDDED JSON EXTRACTION ===")
         try:
-            # Look for JSON data in script tags
-            json_patterns = [
-                r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-                r'window\.__PRELOADED_STATE__\s*=\s*({.*?});',
-                r'window\.cgData\s*=\s*({.*?});',
-                r'var\s+listingData\s*=\s*(\[.*?\]);'
-            ]
-            
-            for i, pattern in enumerate(json_patterns):
-                matches = re.findall(pattern, html_content, re.DOTALL)
-                if matches:
+            # Look for JSON data in script tags (only the first match of each pattern is used)
+            for i, pattern in enumerate(_EMBEDDED_JSON_RES):
+                match = pattern.search(html_content)
+                if match:
                     try:
-                        json_data = json.loads(matches[0])
-                        logger.info(f"Found embedded JSON data with pattern {i+1}, keys: {list(json_data.keys()) if isinstance(json_data, dict) else 'Array'}")
+                        json_data = _json_loads(match.group(1))
+                        logger.info("Found embedded JSON data with pattern %s, keys: %s", i+1, list(json_data.keys()) if isinstance(json_data, dict) else 'Array')
                         
                         # Try to extract cars from the JSON
                         cars = self._extract_cars_from_json_response(json_data)
                         if cars:
-                            logger.info(f"SUCCESS: Embedded JSON extraction found {len(cars)} cars")
+                            logger.info("SUCCESS: Embedded JSON extraction found %s cars", len(cars))
                             return cars
                         else:
                             logger.info("Embedded JSON extraction found no cars")
                             
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse JSON from pattern {i+1}: {e}")
+                    except _JSON_DECODE_ERRORS as e:
+                        logger.warning("Failed to parse JSON from pattern %s: %s", i+1, e)
                         continue
             
             logger.info("No embedded JSON patterns matched")
                         
         except Exception as e:
-            logger.warning(f"Error extracting from embedded JSON: {e}")
+            logger.warning("Error extracting from embedded JSON: %s", e)
             
         logger.info("=== EMBEDDED JSON EXTRACTION FAILED ===")
         return []
@@ -1396,10 +1813,9 @@ class CarGurusScraper:
             # This is a fallback method when other methods fail
             
             # Pattern 1: Look for make/model/year combinations
-            car_pattern = re.compile(r'<[^>]*>([^<]*?)\s+([^<]*?)\s+((?:19|20)\d{2})[^<]*</[^>]*>', re.IGNORECASE)
-            matches = car_pattern.findall(html_content)
+            matches = _HTML_CAR_RE.findall(html_content)
             
-            logger.info(f"Found {len(matches)} potential car matches in HTML patterns")
+            logger.info("Found %s potential car matches in HTML patterns", len(matches))
             
             for i, match in enumerate(matches[:20]):  # Limit results
                 make, model, year = match
@@ -1423,18 +1839,18 @@ class CarGurusScraper:
                             stock_number=""
                         )
                         cars.append(car)
-                        logger.info(f"Created car {i+1} from HTML pattern: {make} {model} {year}")
+                        logger.info("Created car %s from HTML pattern: %s %s %s", i+1, make, model, year)
                     except ValueError as e:
-                        logger.warning(f"Failed to create car from HTML pattern {i+1}: {e}")
+                        logger.warning("Failed to create car from HTML pattern %s: %s", i+1, e)
                         continue
             
             if cars:
-                logger.info(f"SUCCESS: HTML pattern extraction found {len(cars)} cars")
+                logger.info("SUCCESS: HTML pattern extraction found %s cars", len(cars))
             else:
                 logger.info("HTML pattern extraction found no cars")
                         
         except Exception as e:
-            logger.warning(f"Error extracting from HTML patterns: {e}")
+            logger.warning("Error extracting from HTML patterns: %s", e)
             
         logger.info("=== HTML PATTERN EXTRACTION COMPLETED ===")
         return cars 
@@ -1453,15 +1869,16 @@ class CarGurusScraper:
             # Look for search parameters in the HTML
             # These might be in script tags, data attributes, or form elements
             
-            # Pattern 1: Look for searchId in script tags
-            search_id_pattern = r'searchId["\']?\s*[:=]\s*["\']([^"\']+)["\']'
-            search_id_match = re.search(search_id_pattern, html_content)
-            search_id = search_id_match.group(1) if search_id_match else None
-            
-            # Pattern 2: Look for pageReceipt in script tags
-            page_receipt_pattern = r'pageReceipt["\']?\s*[:=]\s*["\']([^"\']+)["\']'
-            page_receipt_match = re.search(page_receipt_pattern, html_content)
-            page_receipt = page_receipt_match.group(1) if page_receipt_match else None
+            # Look for searchId and pageReceipt in script tags, keeping the first of each
+            search_id = None
+            page_receipt = None
+            for match in _SEARCH_PARAMS_RE.finditer(html_content):
+                if search_id is None and match.group('searchId'):
+                    search_id = match.group('searchId')
+                elif page_receipt is None and match.group('pageReceipt'):
+                    page_receipt = match.group('pageReceipt')
+                if search_id is not None and page_receipt is not None:
+                    break
             
             # Map inventory type to CarGurus newUsed parameter (single value format)
             new_used_mapping = {
@@ -1471,7 +1888,7 @@ class CarGurusScraper:
                 "NEW_CERTIFIED": 8  # New Certified only
             }
             new_used_value = new_used_mapping.get(inventory_type.upper(), "")
-            print(f"New Used Value: {new_used_value}")
+            logger.debug("New Used Value: %s", new_used_value)
             
             # Build the search parameters based on the Node.js fetch example
             search_params = {
@@ -1492,56 +1909,59 @@ class CarGurusScraper:
             if page_receipt:
                 search_params['pageReceipt'] = page_receipt
             
-            logger.info(f"Extracted search parameters: {search_params}")
+            logger.info("Extracted search parameters: %s", search_params)
             return search_params
             
         except Exception as e:
-            logger.error(f"Error extracting search parameters: {e}")
+            logger.error("Error extracting search parameters: %s", e)
             return None
 
-    def _extract_cars_from_ajax_response(self, html_content: str, dealer_entity_id: str = "") -> List[ScrapedCar]:
+    def _extract_cars_from_ajax_response(self, html_content: Union[str, bytes], dealer_entity_id: str = "", json_data: Optional[dict] = None) -> List[ScrapedCar]:
         """
         Extract car listings from the AJAX response.
-        The AJAX response contains JSON data with car listings.
+        The AJAX response contains JSON data with car listings; pass json_data when the
+        payload has already been decoded to avoid parsing it again.
         """
         logger.info("=== EXTRACTING CARS FROM AJAX RESPONSE ===")
         
         try:
             # The AJAX response is actually JSON, not HTML
-            # Try to parse it as JSON first
-            try:
-                json_data = json.loads(html_content)
-                logger.info(f"Successfully parsed JSON response with keys: {list(json_data.keys())}")
+            # A JSON payload is handled entirely here; the HTML fallbacks below are never built for it
+            if json_data is None:
+                json_data = _decode_json_payload(html_content)
+            if json_data is not None:
+                logger.info("Successfully parsed JSON response with keys: %s", json_data.keys())
                 
                 # Extract cars from the JSON data
                 cars = self._extract_cars_from_ajax_json(json_data, dealer_entity_id)
-                if cars:
-                    logger.info(f"Successfully extracted {len(cars)} cars from JSON response")
-                    return cars
-                    
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse response as JSON: {e}")
-                # Fall back to HTML parsing if JSON fails
-                pass
+                logger.info("Successfully extracted %s cars from JSON response", len(cars))
+                return [car.to_model() for car in cars]
+            
+            # Fall back to HTML parsing if JSON fails
+            if isinstance(html_content, bytes):
+                html_content = html_content.decode('utf-8', errors='replace')
             
             # Fallback: Try HTML parsing (though this shouldn't be needed)
-            soup = BeautifulSoup(html_content, 'html.parser')
             cars = []
+            try:
+                listing_containers = _AJAX_CONTAINER_XPATH(lxml.html.fromstring(html_content))
+            except (etree.ParserError, ValueError) as e:
+                logger.warning("Failed to parse AJAX response as HTML: %s", e)
+                listing_containers = []
             
             # Method 1: Look for car listing elements in the AJAX response
-            listing_containers = soup.find_all(['div', 'article'], class_=lambda x: x and any(keyword in x.lower() for keyword in ['listing', 'card', 'tile', 'car', 'result']))
             
             if listing_containers:
-                logger.info(f"Found {len(listing_containers)} potential listing containers in AJAX response")
+                logger.info("Found %s potential listing containers in AJAX response", len(listing_containers))
                 
                 for i, container in enumerate(listing_containers):
                     try:
                         car = self._extract_car_from_ajax_listing_container(container)
                         if car:
                             cars.append(car)
-                            logger.info(f"Successfully extracted car {i+1}: {car.make} {car.model} {car.year}")
+                            logger.info("Successfully extracted car %s: %s %s %s", i + 1, car.make, car.model, car.year)
                     except Exception as e:
-                        logger.warning(f"Error extracting car from AJAX container {i+1}: {e}")
+                        logger.warning("Error extracting car from AJAX container %s: %s", i + 1, e)
                         continue
             
             # Method 2: Look for JSON data in the AJAX response
@@ -1554,14 +1974,14 @@ class CarGurusScraper:
                 logger.info("No cars found via JSON, trying HTML pattern matching in AJAX response")
                 cars = self._extract_cars_from_html_patterns(html_content)
             
-            logger.info(f"Successfully extracted {len(cars)} cars from AJAX response")
+            logger.info("Successfully extracted %s cars from AJAX response", len(cars))
             return cars
             
         except Exception as e:
-            logger.error(f"Error extracting cars from AJAX response: {e}")
+            logger.error("Error extracting cars from AJAX response: %s", e)
             return []
 
-    def _extract_cars_from_ajax_json(self, json_data: dict, dealer_entity_id: str = "") -> List[ScrapedCar]:
+    def _extract_cars_from_ajax_json(self, json_data: dict, dealer_entity_id: str = "") -> List[ScrapedCarRow]:
         """
         Extract car listings from the AJAX JSON response.
         The JSON contains a 'tiles' array with car listing data.
@@ -1571,181 +1991,30 @@ class CarGurusScraper:
         try:
             # The JSON response has a 'tiles' array
             tiles = json_data.get('tiles', [])
-            logger.info(f"Found {len(tiles)} tiles in JSON response")
-            
-            for i, tile in enumerate(tiles):
-                try:
-                    # Check if this is a car listing tile
-                    if tile.get('type') == 'LISTING_USED_STANDARD' or tile.get('type') == 'LISTING_NEW_STANDARD':
-                        car_data = tile.get('data', {})
-                        tile_type = tile.get('type', '')  # Pass the tile type!
-                        car = self._extract_car_from_ajax_tile_data(car_data, dealer_entity_id, tile_type)
-                        if car:
-                            cars.append(car)
-                            logger.info(f"Successfully extracted car {i+1}: {car.make} {car.model} {car.year}")
-                    elif tile.get('type') == 'MERCH':
-                        # Skip merchandise/advertisement tiles
-                        logger.debug(f"Skipping MERCH tile {i}")
-                        continue
-                    else:
-                        logger.debug(f"Unknown tile type: {tile.get('type')}")
-                        
-                except Exception as e:
-                    logger.warning(f"Error extracting car from tile {i}: {e}")
-                    continue
+            logger.info("Found %s tiles in JSON response", len(tiles))
+            
+            # One timestamp for the whole page, shared by every worker chunk
+            scraped_at = datetime.now()
+            tile_pool = _get_tile_pool() if len(tiles) > _TILE_POOL_THRESHOLD else None
+            if tile_pool is not None:
+                # Large pages: decode chunks of tiles in worker processes
+                chunk_size = -(-len(tiles) // _TILE_POOL_WORKERS)
+                chunks = [tiles[start:start + chunk_size] for start in range(0, len(tiles), chunk_size)]
+                for chunk_cars in tile_pool.map(_extract_cars_from_ajax_tiles, chunks, repeat(dealer_entity_id), repeat(scraped_at)):
+                    cars.extend(chunk_cars)
+            else:
+                cars = _extract_cars_from_ajax_tiles(tiles, dealer_entity_id, scraped_at)
             
-            logger.info(f"Successfully extracted {len(cars)} cars from JSON tiles")
+            logger.info("Successfully extracted %s cars from JSON tiles", len(cars))
             return cars
             
         except Exception as e:
-            logger.error(f"Error extracting cars from AJAX JSON: {e}")
+            logger.error("Error extracting cars from AJAX JSON: %s", e)
             return []
 
-    def _extract_car_from_ajax_tile_data(self, car_data: dict, dealer_entity_id: str = "", tile_type: str = "") -> Optional[ScrapedCar]:
-        """
-        Extract car data from a single tile in the AJAX JSON response.
-        """
-        try:
-            # Extract basic car information
-            make = car_data.get('makeName', '')
-            model = car_data.get('modelName', '')
-            year = car_data.get('carYear', 0)
-            price = car_data.get('price', 0.0)
-            
-            # Extract listing ID for URL construction
-            listing_id = car_data.get('id', '')
-            
-            # Extract description/title
-            description = car_data.get('listingTitle', '')
-            if not description:
-                description = f"{year} {make} {model}"
-            
-            # Extract features from options
-            features = car_data.get('options', [])
-            
-            # Extract stats
-            stats = []
-
-            # Add condition based on tile type (CRITICAL FIX!)
-            if tile_type == 'LISTING_NEW_STANDARD':
-                stats.append({"header": "Condition", "value": "New"})
-            elif tile_type == 'LISTING_USED_STANDARD':
-                stats.append({"header": "Condition", "value": "Used"})
-            mileage = car_data.get('mileageString', '')
-            if mileage:
-                stats.append({"header": "Mileage", "value": mileage})
-            
-            transmission = car_data.get('localizedTransmission', '')
-            if transmission:
-                stats.append({"header": "Transmission", "value": transmission})
-            
-            drivetrain = car_data.get('localizedDriveTrain', '')
-            if drivetrain:
-                stats.append({"header": "Drivetrain", "value": drivetrain})
-            
-            fuel_type = car_data.get('localizedFuelType', '')
-            if fuel_type:
-                stats.append({"header": "Fuel Type", "value": fuel_type})
-            
-            engine = car_data.get('localizedEngineDisplayName', '')
-            if engine:
-                stats.append({"header": "Engine", "value": engine})
-            
-            # Extract vehicle appearance details
-            exterior_color = car_data.get('localizedExteriorColor', '')
-            interior_color = car_data.get('localizedInteriorColor', '')
-            # Note: bodyStyle is not in the tile data, but may be added if available
-            body_style = car_data.get('bodyStyle', '')
-            
-            # Extract images (collect all, not just primary)
-            images = []
-            original_picture = car_data.get('originalPictureData', {})
-            if original_picture and original_picture.get('url'):
-                images.append(original_picture['url'])
-
-            # Additional sources commonly present on tiles
-            # 1) pictures: [{ url: ... }]
-            pictures = car_data.get('pictures') or car_data.get('pictureData') or []
-            if isinstance(pictures, list):
-                for pic in pictures:
-                    if isinstance(pic, dict):
-                        url = pic.get('url') or pic.get('imageUrl') or pic.get('src') or pic.get('photoUrl')
-                        if url and url not in images:
-                            images.append(url)
-                    elif isinstance(pic, str) and pic and pic not in images:
-                        images.append(pic)
-
-            # 2) other potential fields that sometimes hold arrays/objects of image urls
-            for field in ['images', 'photos', 'gallery', 'imageGallery', 'additionalImages']:
-                field_data = car_data.get(field)
-                if not field_data:
-                    continue
-                if isinstance(field_data, list):
-                    for item in field_data:
-                        if isinstance(item, dict):
-                            for key in ['url', 'imageUrl', 'photoUrl', 'src']:
-                                u = item.get(key)
-                                if u and u not in images:
-                                    images.append(u)
-                        elif isinstance(item, str) and item not in images:
-                            images.append(item)
-                elif isinstance(field_data, dict):
-                    for key in ['url', 'imageUrl', 'photoUrl', 'src']:
-                        u = field_data.get(key)
-                        if u and u not in images:
-                            images.append(u)
-            
-            # Extract VIN and stock number
-            vin = car_data.get('vin', '')
-            stock_number = car_data.get('stockNumber', '')
-            
-            # Construct the full title
-            trim = car_data.get('trimName', '')
-            if trim and trim.strip():
-                full_title = f"{year} {make} {model} {trim}".strip()
-            else:
-                full_title = f"{year} {make} {model}".strip()
-            
-            # Construct the original CarGurus URL
-            original_url = ""
-            if listing_id and dealer_entity_id:
-                original_url = f"https://www.cargurus.com/Cars/inventorylisting/vdp.action?listingId={listing_id}&entitySelectingHelper.selectedEntity=sp{dealer_entity_id}#listing={listing_id}/NONE/DEFAULT"
-            elif listing_id:
-                # Fallback URL without dealer entity if not provided
-                original_url = f"https://www.cargurus.com/Cars/inventorylisting/vdp.action?listingId={listing_id}#listing={listing_id}/NONE/DEFAULT"
-            
-            # Validate that we have at least basic information
-            if not make or not model or year == 0:
-                logger.warning(f"Insufficient car data in tile: make={make}, model={model}, year={year}")
-                return None
-            
-            logger.info(f"Extracted car: {full_title} - ${price:,} - URL: {original_url}")
-            logger.info(f"Extracted colors - Exterior: {exterior_color}, Interior: {interior_color}, Body Style: {body_style}")
-            
-            return ScrapedCar(
-                make=make,
-                model=model,
-                year=year,
-                price=price,
-                description=description,
-                features=features,
-                stats=stats,
-                images=images,
-                originalUrl=original_url,
-                fullTitle=full_title,
-                exteriorColor=exterior_color,
-                interiorColor=interior_color,
-                bodyStyle=body_style
-            )
-                
-        except Exception as e:
-            logger.warning(f"Error extracting car from tile data: {e}")
-            
-        return None 
-
     def _extract_car_from_ajax_listing_container(self, container) -> Optional[ScrapedCar]:
         """
-        Extract car data from a single listing container in the AJAX response.
+        Extract car data from a single listing container (an lxml element) in the AJAX response.
         This should be more reliable than the main page extraction.
         """
         logger.info("=== EXTRACTING CAR FROM AJAX LISTING CONTAINER ===")
@@ -1754,36 +2023,36 @@ class CarGurusScraper:
             # Look for more specific selectors that might be used in AJAX responses
             
             # Look for title/name elements
-            title_elem = container.find(['h3', 'h4', 'h5', 'div'], class_=lambda x: x and any(keyword in x.lower() for keyword in ['title', 'name', 'heading']))
+            title_elems = _AJAX_TITLE_XPATH(container)
             
-            if title_elem:
-                title_text = title_elem.get_text(strip=True)
-                logger.info(f"Found title element: {title_text}")
+            if title_elems:
+                title_text = _element_text(title_elems[0])
+                logger.info("Found title element: %s", title_text)
                 
                 # Parse year, make, model from title
                 car_info = self._parse_car_title(title_text)
                 if car_info:
                     make, model, year = car_info
-                    logger.info(f"Parsed car info: {make} {model} {year}")
+                    logger.info("Parsed car info: %s %s %s", make, model, year)
                     
                     # Look for price
-                    price_elem = container.find(['span', 'div'], class_=lambda x: x and any(keyword in x.lower() for keyword in ['price', 'cost']))
+                    price_elems = _AJAX_PRICE_XPATH(container)
                     price = 0
-                    if price_elem:
-                        price_text = price_elem.get_text(strip=True)
-                        price_match = re.search(r'\$([\d,]+)', price_text)
+                    if price_elems:
+                        price_text = _element_text(price_elems[0])
+                        price_match = _PRICE_RE.search(price_text)
                         if price_match:
                             price = int(price_match.group(1).replace(',', ''))
-                            logger.info(f"Found price: ${price}")
+                            logger.info("Found price: $%s", price)
                     
                     # Look for description
-                    desc_elem = container.find(['p', 'div'], class_=lambda x: x and any(keyword in x.lower() for keyword in ['description', 'desc', 'summary']))
-                    description = desc_elem.get_text(strip=True) if desc_elem else "No description available."
+                    desc_elems = _AJAX_DESC_XPATH(container)
+                    description = _element_text(desc_elems[0]) if desc_elems else "No description available."
                     
                     # Look for images
-                    img_elem = container.find('img')
-                    images = [img_elem.get('src')] if img_elem and img_elem.get('src') else []
-                    logger.info(f"Found {len(images)} images in AJAX container")
+                    img_elem = container.find('.//img')
+                    images = [img_elem.get('src')] if img_elem is not None and img_elem.get('src') else []
+                    logger.info("Found %s images in AJAX container", len(images))
                     
                     # Create the car object
                     car = ScrapedCar(
@@ -1800,12 +2069,9 @@ class CarGurusScraper:
                     )
                     
                     return car
-            
-            # Fallback: Try the same method as the main page
-            return self._extract_car_from_dealer_listing_container(container)
                 
         except Exception as e:
-            logger.warning(f"Error extracting car from AJAX container: {e}")
+            logger.warning("Error extracting car from AJAX container: %s", e)
             
         return None
 
@@ -1813,25 +2079,18 @@ class CarGurusScraper:
         """
         Parse year, make, and model from a car title string.
         """
-        try:
-            # Pattern: "2022 Toyota Camry LE" or "2022 Toyota Camry"
-            pattern = r'(\d{4})\s+([A-Za-z]+)\s+([A-Za-z0-9\s\-]+)'
-            match = re.search(pattern, title_text)
-            
-            if match:
-                year = int(match.group(1))
-                make = match.group(2).strip()
-                model = match.group(3).strip()
-                
-                # Validate year
-                if 1900 <= year <= 2030:
-                    return (make, model, year)
-            
+        # Format: "2022 Toyota Camry LE" or "2022 Toyota Camry"
+        parts = title_text.split(None, 2)
+        if len(parts) < 3 or len(parts[0]) != 4 or not parts[0].isdecimal():
             return None
-            
-        except Exception as e:
-            logger.warning(f"Error parsing car title '{title_text}': {e}")
+        
+        year = int(parts[0])
+        
+        # Validate year
+        if not 1900 <= year <= 2030:
             return None
+        
+        return (parts[1], parts[2].strip(), year)
 
     def _extract_pagination_info_from_ajax_response(self, html_content: str) -> dict:
         """
@@ -1840,7 +2099,7 @@ class CarGurusScraper:
         try:
             # Since the AJAX response is JSON, try to parse it first
             try:
-                json_data = json.loads(html_content)
+                json_data = _json_loads(html_content)
                 # Look for pagination info in the JSON
                 page_number = json_data.get('pageNumber', 1)
                 # We can't determine total pages from this response, but we can check if there are more tiles
@@ -1852,38 +2111,45 @@ class CarGurusScraper:
                     'totalPages': 0,    # We can't determine this from this response
                     'hasNextPage': has_next
                 }
-            except json.JSONDecodeError:
+            except _JSON_DECODE_ERRORS:
                 pass
             
             # Fallback: Look for pagination information in HTML (if response is HTML)
+            # Both HTML patterns need the word "pagination"; skip them entirely when it's absent
+            if not _PAGINATION_CLASS_RE.search(html_content):
+                return {
+                    'totalResults': 0,
+                    'totalPages': 1,
+                    'hasNextPage': False
+                }
+            
             # Pattern 1: Look for pagination JSON
-            pagination_pattern = r'pagination["\']?\s*[:=]\s*({[^}]+})'
-            pagination_match = re.search(pagination_pattern, html_content)
+            pagination_match = _PAGINATION_RE.search(html_content)
             
             if pagination_match:
                 try:
-                    pagination_data = json.loads(pagination_match.group(1))
+                    pagination_data = _json_loads(pagination_match.group(1))
                     return {
                         'totalResults': pagination_data.get('totalResults', 0),
                         'totalPages': pagination_data.get('totalPages', 1),
                         'hasNextPage': pagination_data.get('hasNextPage', False)
                     }
-                except json.JSONDecodeError:
+                except _JSON_DECODE_ERRORS:
                     pass
             
             # Pattern 2: Look for pagination in HTML
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml', parse_only=_PAGINATION_STRAINER)
             
             # Look for pagination elements
-            pagination_elem = soup.find(['div', 'nav'], class_=lambda x: x and 'pagination' in x.lower())
+            pagination_elem = soup.find(['div', 'nav'], class_=_PAGINATION_CLASS_RE)
             
             if pagination_elem:
                 # Count page numbers
-                page_numbers = pagination_elem.find_all(['a', 'span'], string=re.compile(r'\d+'))
+                page_numbers = pagination_elem.find_all(['a', 'span'], string=_PAGE_NUMBER_RE)
                 total_pages = len(page_numbers) if page_numbers else 1
                 
                 # Check for next button
-                next_button = pagination_elem.find(['a', 'button'], string=re.compile(r'next|>', re.I))
+                next_button = pagination_elem.find(['a', 'button'], string=_NEXT_BUTTON_RE)
                 has_next = next_button is not None
                 
                 return {
@@ -1900,7 +2166,7 @@ class CarGurusScraper:
             }
             
         except Exception as e:
-            logger.warning(f"Error extracting pagination info: {e}")
+            logger.warning("Error extracting pagination info: %s", e)
             return {
                 'totalResults': 0,
                 'totalPages': 1,
@@ -1921,64 +2187,56 @@ class CarGurusScraper:
         try:
             # Look for the H1 tag with class="dealerName" that contains the total cars
             # Pattern: <h1 class="dealerName">... - 163 Cars for Sale</h1>
-            dealer_name_pattern = r'<h1[^>]*class="dealerName"[^>]*>.*?-\s*(\d+)\s+Cars?\s+for\s+Sale\s*</h1>'
-            match = re.search(dealer_name_pattern, html_content, re.IGNORECASE | re.DOTALL)
-            
-            if match:
-                total_cars = int(match.group(1))
-                logger.info(f"Extracted total cars from dealer page: {total_cars}")
-                return total_cars
+            # Locate the heading with a plain substring scan, then only search up to its closing tag
+            start = html_content.find(_DEALER_NAME_MARKER)
+            if start != -1:
+                end = html_content.find('</h1>', start, start + _DEALER_NAME_WINDOW)
+                if end == -1:
+                    end = start + _DEALER_NAME_WINDOW
+                match = _CARS_FOR_SALE_RE.search(html_content, start, end)
+                
+                if match:
+                    total_cars = int(match.group(1))
+                    logger.info("Extracted total cars from dealer page: %s", total_cars)
+                    return total_cars
             
             # Alternative pattern: Look for "X Cars for Sale" anywhere in the page
-            cars_pattern = r'(\d+)\s+Cars?\s+for\s+Sale'
-            match = re.search(cars_pattern, html_content, re.IGNORECASE)
+            match = _CARS_FOR_SALE_RE.search(html_content)
             
             if match:
                 total_cars = int(match.group(1))
-                logger.info(f"Extracted total cars using alternative pattern: {total_cars}")
+                logger.info("Extracted total cars using alternative pattern: %s", total_cars)
                 return total_cars
             
-            # Try parsing with BeautifulSoup as fallback
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Look for H1 with dealerName class
-            dealer_h1 = soup.find('h1', class_='dealerName')
-            if dealer_h1:
-                h1_text = dealer_h1.get_text()
-                # Extract number from text like "Asheboro Chrysler Dodge Jeep Ram - 163 Cars for Sale"
-                cars_match = re.search(r'(\d+)\s+Cars?\s+for\s+Sale', h1_text, re.IGNORECASE)
-                if cars_match:
-                    total_cars = int(cars_match.group(1))
-                    logger.info(f"Extracted total cars using BeautifulSoup: {total_cars}")
-                    return total_cars
-            
-            logger.warning(f"Could not extract total cars from dealer page for dealer {dealer_entity_id}")
+            logger.warning("Could not extract total cars from dealer page for dealer %s", dealer_entity_id)
             return 0
             
         except Exception as e:
-            logger.error(f"Error extracting total cars from dealer page: {e}")
+            logger.error("Error extracting total cars from dealer page: %s", e)
             return 0
 
-    def _extract_total_cars_from_ajax_response(self, ajax_response_text: str) -> int:
+    def _extract_total_cars_from_ajax_response(self, ajax_response_text: Union[str, bytes], json_data: Optional[dict] = None) -> int:
         """
         Extract the total number of cars from the AJAX response JSON.
         
         Args:
-            ajax_response_text: JSON response text from the AJAX request
+            ajax_response_text: JSON response text (or raw bytes) from the AJAX request
+            json_data: Already-decoded response, if available
             
         Returns:
             Total number of cars as integer, or 0 if not found
         """
         try:
             # Try to parse the AJAX response as JSON
-            json_data = json.loads(ajax_response_text)
+            if json_data is None:
+                json_data = _json_loads(ajax_response_text)
             
             # Look for totalListings in the JSON response
             # Based on the curl response, it should be at the root level
             total_listings = json_data.get('totalListings', 0)
             
             if total_listings > 0:
-                logger.info(f"Extracted total cars from AJAX response: {total_listings}")
+                logger.info("Extracted total cars from AJAX response: %s", total_listings)
                 return total_listings
             
             # Fallback: try to find it in other common locations
@@ -1988,15 +2246,15 @@ class CarGurusScraper:
                     count_data = srp_data['defaultSRPListingCount']
                     total_listings = count_data.get('totalListings', 0)
                     if total_listings > 0:
-                        logger.info(f"Extracted total cars from srpTrackingData: {total_listings}")
+                        logger.info("Extracted total cars from srpTrackingData: %s", total_listings)
                         return total_listings
             
             logger.warning("Could not extract total cars from AJAX response")
             return 0
             
-        except json.JSONDecodeError:
+        except _JSON_DECODE_ERRORS:
             logger.warning("AJAX response is not valid JSON, cannot extract total cars")
             return 0
         except Exception as e:
-            logger.error(f"Error extracting total cars from AJAX response: {e}")
+            logger.error("Error extracting total cars from AJAX response: %s", e)
             return 0 
\ No newline at end of file
@@ -1,3 +1,4 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional
 
@@ -39,6 +40,8 @@ class ScrapedCar(BaseModel):
     bodyStyle: str = Field(default="", description="Body style from CarGurus")
     
     model_config = ConfigDict(
+        defer_build=True,
+        from_attributes=True,
         json_schema_extra={
             "example": {
                 "make": "Toyota",
@@ -55,6 +58,47 @@ class ScrapedCar(BaseModel):
             }
         }
     )
+    
+    @classmethod
+    def from_scraped(cls, data: dict) -> "ScrapedCar":
+        """Build a ScrapedCar from trusted scraper output without re-running validation"""
+        return cls.model_construct(**data)
+
+@dataclass(slots=True)
+class ScrapedCarRow:
+    """
+    Slotted transport object for cars built on the scraper hot path
+    
+    Mirrors the fields of ScrapedCar without the per-instance __dict__ and
+    validation cost. Rows are accepted anywhere a ScrapedCar is expected
+    (ScrapedCar has from_attributes enabled); to_model() builds the response
+    model directly when the data is known to come from the scraper.
+    """
+    make: str
+    model: str
+    year: int
+    price: float
+    originalUrl: str
+    description: str = ""
+    features: List[str] = field(default_factory=list)
+    stats: List[dict] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+    fullTitle: str = ""
+    scrapedAt: datetime = field(default_factory=datetime.now)
+    exteriorColor: str = ""
+    interiorColor: str = ""
+    bodyStyle: str = ""
+    
+    def __post_init__(self):
+        """Enforce the ScrapedCar limits that to_model() skips, so builders still drop bad listings"""
+        if self.price is None or not self.price >= 0:
+            raise ValueError(f"price must be a number >= 0, got {self.price!r}")
+        if self.year is None or not 1900 <= self.year <= 2030:
+            raise ValueError(f"year must be between 1900 and 2030, got {self.year!r}")
+    
+    def to_model(self) -> ScrapedCar:
+        """Convert to a ScrapedCar without re-running validation on trusted scraper output"""
+        return ScrapedCar.from_scraped({name: getattr(self, name) for name in self.__slots__})
 
 class InventorySearchRequest(BaseModel):
     """
@@ -74,6 +118,7 @@ class InventorySearchRequest(BaseModel):
     newUsed: int = Field(default=1, description="Type of cars to search (1=New, 2=Used, 3=Both)")
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "zip": "27401",
@@ -85,6 +130,46 @@ class InventorySearchRequest(BaseModel):
         }
     )
 
+class InventorySearchPagesRequest(BaseModel):
+    """
+    Model representing a request for several pages of one inventory search
+    
+    Attributes:
+        zip: ZIP code for search location
+        distance: Search radius in miles
+        srpVariation: Search variation type (e.g., "NEW_CAR_SEARCH", "USED_CAR_SEARCH")
+        pageNumbers: Page numbers to fetch, returned in the same order
+        newUsed: Type of cars to search (1=New, 2=Used, 3=Both)
+    """
+    zip: str = Field(..., description="ZIP code for search location")
+    distance: int = Field(default=100, description="Search radius in miles", ge=1, le=500)
+    srpVariation: str = Field(default="NEW_CAR_SEARCH", description="Search variation type")
+    pageNumbers: List[int] = Field(..., description="Page numbers to fetch", min_length=1)
+    newUsed: int = Field(default=1, description="Type of cars to search (1=New, 2=Used, 3=Both)")
+    
+    model_config = ConfigDict(
+        defer_build=True,
+        json_schema_extra={
+            "example": {
+                "zip": "27401",
+                "distance": 100,
+                "srpVariation": "NEW_CAR_SEARCH",
+                "pageNumbers": [1, 2, 3],
+                "newUsed": 1
+            }
+        }
+    )
+    
+    def page_request(self, page_number: int) -> InventorySearchRequest:
+        """Build the single-page InventorySearchRequest for one of the requested pages"""
+        return InventorySearchRequest(
+            zip=self.zip,
+            distance=self.distance,
+            srpVariation=self.srpVariation,
+            pageNumber=page_number,
+            newUsed=self.newUsed
+        )
+
 class DealerInventoryRequest(BaseModel):
     """
     Model representing a dealer inventory request
@@ -103,6 +188,7 @@ class DealerInventoryRequest(BaseModel):
     inventoryType: str = Field(default="ALL", description="Type of inventory to search (ALL, NEW, USED, NEW_CERTIFIED)")
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "dealerEntityId": "317131",
@@ -142,6 +228,7 @@ class InventorySearchResult(BaseModel):
     processingTime: float = Field(..., description="Processing time in seconds")
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "success": True,
@@ -172,6 +259,90 @@ class InventorySearchResult(BaseModel):
         }
     )
 
+class InventorySearchColumns(BaseModel):
+    """
+    Model representing an inventory search result in structure-of-arrays form
+    
+    Carries the same pagination fields as InventorySearchResult, but the cars are
+    given as one list per ScrapedCar field (the i-th entry of every list belongs
+    to the i-th car) instead of one object per car, so the field names are sent
+    once per page rather than once per car.
+    
+    Attributes:
+        success: Whether search was successful
+        count: Number of cars (the length of every column)
+        makes, models, years, prices, descriptions, features, stats, images,
+        originalUrls, fullTitles, scrapedAt, exteriorColors, interiorColors,
+        bodyStyles: Per-car columns, one per ScrapedCar field
+        totalResults: Total number of results available
+        currentPage: Current page number
+        totalPages: Total number of pages
+        hasNextPage: Whether there is a next page available
+        hasPreviousPage: Whether there is a previous page available
+        message: Success or error message
+        errorMessage: Error message if failed
+        processingTime: Time taken to process the request
+    """
+    success: bool = Field(..., description="Whether search was successful")
+    count: int = Field(default=0, description="Number of cars in every column")
+    makes: List[str] = Field(default_factory=list, description="Car manufacturers")
+    models: List[str] = Field(default_factory=list, description="Car models")
+    years: List[int] = Field(default_factory=list, description="Manufacturing years")
+    prices: List[float] = Field(default_factory=list, description="Car prices in USD")
+    descriptions: List[str] = Field(default_factory=list, description="Car descriptions")
+    features: List[List[str]] = Field(default_factory=list, description="Feature lists")
+    stats: List[List[dict]] = Field(default_factory=list, description="Statistics lists (header/value pairs)")
+    images: List[List[str]] = Field(default_factory=list, description="Image URL lists")
+    originalUrls: List[str] = Field(default_factory=list, description="Original CarGurus URLs")
+    fullTitles: List[str] = Field(default_factory=list, description="Complete car titles")
+    scrapedAt: List[datetime] = Field(default_factory=list, description="Scraping timestamps")
+    exteriorColors: List[str] = Field(default_factory=list, description="Exterior colors")
+    interiorColors: List[str] = Field(default_factory=list, description="Interior colors")
+    bodyStyles: List[str] = Field(default_factory=list, description="Body styles")
+    totalResults: int = Field(default=0, description="Total number of results available")
+    currentPage: int = Field(default=1, description="Current page number")
+    totalPages: int = Field(default=1, description="Total number of pages")
+    hasNextPage: bool = Field(default=False, description="Whether there is a next page available")
+    hasPreviousPage: bool = Field(default=False, description="Whether there is a previous page available")
+    message: Optional[str] = Field(None, description="Success or error message")
+    errorMessage: Optional[str] = Field(None, description="Error message if failed")
+    processingTime: float = Field(..., description="Processing time in seconds")
+    
+    # Not deferred: instances only ever come from model_construct in from_result, which never
+    # triggers a deferred build, and main.py serializes them with pydantic-core directly
+    model_config = ConfigDict()
+    
+    @classmethod
+    def from_result(cls, result: InventorySearchResult) -> "InventorySearchColumns":
+        """Pivot an InventorySearchResult into columns without re-running validation"""
+        cars = result.cars
+        return cls.model_construct(
+            success=result.success,
+            count=len(cars),
+            makes=[car.make for car in cars],
+            models=[car.model for car in cars],
+            years=[car.year for car in cars],
+            prices=[car.price for car in cars],
+            descriptions=[car.description for car in cars],
+            features=[car.features for car in cars],
+            stats=[car.stats for car in cars],
+            images=[car.images for car in cars],
+            originalUrls=[car.originalUrl for car in cars],
+            fullTitles=[car.fullTitle for car in cars],
+            scrapedAt=[car.scrapedAt for car in cars],
+            exteriorColors=[car.exteriorColor for car in cars],
+            interiorColors=[car.interiorColor for car in cars],
+            bodyStyles=[car.bodyStyle for car in cars],
+            totalResults=result.totalResults,
+            currentPage=result.currentPage,
+            totalPages=result.totalPages,
+            hasNextPage=result.hasNextPage,
+            hasPreviousPage=result.hasPreviousPage,
+            message=result.message,
+            errorMessage=result.errorMessage,
+            processingTime=result.processingTime
+        )
+
 class ScrapingResult(BaseModel):
     """
     Model representing the result of a scraping operation
@@ -188,6 +359,7 @@ class ScrapingResult(BaseModel):
     processingTime: float = Field(..., description="Processing time in seconds")
     
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "success": True,
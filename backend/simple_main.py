@@ -1,24 +1,171 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional, Dict, Any
+import asyncio
 import uvicorn
 import requests
 import logging
+import multiprocessing
+import orjson
+import os
+import random
 import re
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlencode, urljoin
+import lxml.html
+from requests.adapters import HTTPAdapter
+from lxml import etree
 import time
-from datetime import datetime
-from pydantic import BaseModel
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pydantic import BaseModel, HttpUrl, TypeAdapter, ValidationError
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Built once and reused: constructing a TypeAdapter compiles a validator
+_URL_ADAPTER = TypeAdapter(HttpUrl)
+
+# Listing pages all live under /Cars/ on the CarGurus hosts
+_CARGURUS_CARS_PREFIXES = (
+    'https://www.cargurus.com/Cars/',
+    'https://cargurus.com/Cars/',
+    'http://www.cargurus.com/Cars/',
+    'http://cargurus.com/Cars/',
+)
+
+# Detail pages are parsed in worker processes when another parse is already running, so
+# concurrent scrapes aren't serialized on the GIL. Workers start from a forkserver (spawn where
+# that's unavailable) rather than being forked from this multithreaded server, whose other
+# threads may hold logging/connection-pool locks at fork time and deadlock the child.
+_PARSE_POOL_WORKERS = os.cpu_count() or 1
+_PARSE_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+# Created by the first contended parse, so importing this module starts no worker processes
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parses_in_flight = 0
+_parses_lock = threading.Lock()
+
+# Transient responses worth retrying, and the longest wait between fetch attempts (seconds)
+_RETRYABLE_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+_RETRY_BACKOFF_CAP = 10
+_FETCH_CHUNK_SIZE = 65536
+_MAX_PAGE_BYTES = 4 * 1024 * 1024
+# CarGurus serves UTF-8; raw page bytes are parsed as such rather than sniffed per parser
+_PAGE_ENCODING = 'utf-8'
+_PAGE_PARSER = lxml.html.HTMLParser(encoding=_PAGE_ENCODING)
+
+# Scrapes and search pages are reused for a short while, since the UI re-requests the same
+# listing/page in quick succession; failed searches are kept only briefly (seconds)
+_CACHE_MAXSIZE = 512
+_CACHE_TTL = 120
+_CACHE_ERROR_TTL = 15
+
+# Constant strings used when building cars from listings and tiles
+_PLACEHOLDER_IMG = "https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop"
+_CARS_URL = "https://www.cargurus.com/Cars"
+_LISTING_URL_PREFIX = "https://www.cargurus.com/Cars/l-"
+
+# CarGurus search page and the query parameters every search sends unchanged
+_SEARCH_URL = "https://www.cargurus.com/Cars/searchPage.action"
+_SEARCH_BASE_PARAMS = {
+    "sourceContext": "carGurusHomePageModel",
+    "isDeliveryEnabled": "true",
+    "nonShippableBaseline": "0",
+}
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_YEAR_BYTES_RE = re.compile(rb'\b(?:19|20)\d{2}\b')
+_PRICE_STRIP_RE = re.compile(r'[^\d.]')
+_PRICE_TEXT_RE = re.compile(r'\$?[\d,]+(?:\.\d{2})?')
+_WORD_RE = re.compile(r'[a-z]+')
+
+# schema.org types CarGurus uses for the listing's structured data
+_JSON_LD_TYPE = 'application/ld+json'
+_JSON_LD_VEHICLE_TYPES = frozenset(('Vehicle', 'Car', 'Product'))
+# Plain str results (not lxml smart strings, which orjson rejects)
+_JSON_LD_XPATH = etree.XPath(f'//script[@type="{_JSON_LD_TYPE}"]/text()', smart_strings=False)
+
+# Common car makes to look for in the page title, keyed by lowercase word
+_KNOWN_MAKES = {
+    make.lower(): make
+    for make in ('Toyota', 'Honda', 'Ford', 'Chevrolet', 'Nissan', 'BMW', 'Mercedes', 'Audi', 'Lexus', 'Hyundai')
+}
+
+# Detail pages are parsed once with lxml and read with compiled XPath queries. Every
+# descendant variant the old CSS selector lists tried (e.g. div[class*="vehicle-title"]
+# span[class*="make"]) is a subset of the bare span[class*="make"] match, so each field
+# is a single query; matches come back in document order.
+_DETAIL_MAKE_XPATH = etree.XPath('//span[contains(@class, "make")]')
+_DETAIL_MODEL_XPATH = etree.XPath('//span[contains(@class, "model")]')
+_DETAIL_YEAR_XPATH = etree.XPath('//span[contains(@class, "year")]')
+_DETAIL_PRICE_XPATH = etree.XPath('//*[self::span or self::div][contains(@class, "price")]')
+_DETAIL_DESCRIPTION_XPATH = etree.XPath(
+    '//*[self::div[contains(@class, "description") or contains(@class, "overview")]'
+    ' or self::p[contains(@class, "description")]]'
+)
+# Union of div[class*="features"|"specs"|"vehicle-features"|"car-features"] li and ul[class*="features"] li
+_DETAIL_FEATURE_XPATH = etree.XPath(
+    '//li[ancestor::div[contains(@class, "features") or contains(@class, "specs")]'
+    ' or ancestor::ul[contains(@class, "features")]]'
+)
+# Union of img[class*="vehicle-image"|"car-image"|"listing-image"] and div[class*="gallery"|"car-gallery"] img
+_DETAIL_IMAGE_XPATH = etree.XPath(
+    '//img[contains(@class, "vehicle-image") or contains(@class, "car-image")'
+    ' or contains(@class, "listing-image") or ancestor::div[contains(@class, "gallery")]]'
+)
+
+# Search pages are walked the same way; each query mirrors the CSS selector it replaced
+_REGEX_NS = {'re': 'http://exslt.org/regular-expressions'}
+_CAR_CLASS_TEST = "re:test(@class, 'car|listing|vehicle', 'i')"
+# Listing container rules, tried in order until one matches. div[class*="listing"] is
+# fetched once: the listing-card and car-listing rules (and the final catch-all) are
+# filtered from those matches in Python rather than each walking the tree again.
+_SEARCH_LISTING_DIV_XPATH = etree.XPath('//div[contains(@class, "listing")]')
+_SEARCH_CONTAINER_RULES = (
+    # (selector, fragment of the listing div's class, or None when the rule has its own query)
+    ('div[class*="listing-card"]', 'listing-card', None),
+    ('div[class*="car-listing"]', 'car-listing', None),
+    ('div[class*="vehicle-card"]', None, etree.XPath('//div[contains(@class, "vehicle-card")]')),
+    ('div[data-cg-car-id]', None, etree.XPath('//div[@data-cg-car-id]')),
+    ('article[class*="listing"]', None, etree.XPath('//article[contains(@class, "listing")]')),
+    ('div[class*="result-item"]', None, etree.XPath('//div[contains(@class, "result-item")]')),
+    ('div[class*="search-result"]', None, etree.XPath('//div[contains(@class, "search-result")]')),
+    ('div[class*="listing"]', 'listing', None),
+)
+# Last-resort container test; matched in Python, which beats re:test's per-element callbacks
+_CAR_CLASS_RE = re.compile(r'car|listing|vehicle', re.IGNORECASE)
+_CAR_RELATED_XPATH = etree.XPath(f"//*[{_CAR_CLASS_TEST}]", namespaces=_REGEX_NS)
+_PAGE_TITLE_XPATH = etree.XPath('//title')
+_DIV_COUNT_XPATH = etree.XPath('count(//div)')
+_ARTICLE_COUNT_XPATH = etree.XPath('count(//article)')
+
+# Search-result listing fields; alternatives are combined so each field is one tree walk
+_LISTING_MAKE_XPATH = etree.XPath('.//*[contains(@class, "make") or contains(@class, "brand")]')
+_LISTING_MODEL_XPATH = etree.XPath('.//*[contains(@class, "model")]')
+_LISTING_YEAR_XPATH = etree.XPath('.//*[contains(@class, "year")]')
+_LISTING_PRICE_XPATH = etree.XPath('.//*[contains(@class, "price")]')
+# Title alternatives stay ordered: a generic "name" class often appears before the real title
+_LISTING_TITLE_XPATHS = tuple(etree.XPath(xpath) for xpath in (
+    './/*[contains(@class, "title")]',
+    './/*[contains(@class, "name")]',
+    './/h1',
+    './/h2',
+    './/h3',
+))
+_LISTING_LINK_XPATH = etree.XPath('.//a[@href]')
+_LISTING_IMAGE_XPATH = etree.XPath('.//img[@src]')
+# Visible text of an element, like bs4's get_text (script/style bodies and comments excluded)
+_VISIBLE_TEXT_XPATH = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+
 app = FastAPI(
     title="Car Lister API",
     description="Backend API for Car Lister PWA - CarGurus scraping service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for all possible frontend origins
@@ -40,6 +187,15 @@ app.add_middleware(
     expose_headers=["*"]
 )
 
+@app.on_event("shutdown")
+def _stop_parse_pool():
+    """Stop the detail-page parse workers, if a contended parse ever started them"""
+    global _parse_pool
+    with _parses_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown()
+
 # Pydantic models for inventory search
 class InventorySearchRequest(BaseModel):
     zip: str
@@ -57,9 +213,118 @@ class InventorySearchResult(BaseModel):
     errorMessage: Optional[str] = None
     processingTime: float = 0.0
 
+@dataclass(slots=True)
+class _ScrapedCarRaw:
+    """Slotted car record passed from the detail-page extractors to /api/scrape"""
+    make: str
+    model: str
+    year: int
+    price: float
+    description: str
+    originalUrl: str
+    scrapedAt: str
+    features: List[str] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the JSON shape returned by the API"""
+        return {
+            "make": self.make,
+            "model": self.model,
+            "year": self.year,
+            "price": self.price,
+            "description": self.description,
+            "features": self.features,
+            "images": self.images,
+            "originalUrl": self.originalUrl,
+            "scrapedAt": self.scrapedAt
+        }
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL"""
+    
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        # key -> (expiry, value), least recently used first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key, value, ttl: float) -> None:
+        """Cache value under key for ttl seconds, evicting the least recently used entry when full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+def _decode_json_payload(payload: bytes) -> Optional[Any]:
+    """Decode a JSON object/array payload with orjson, or return None if the payload is not JSON"""
+    # Peek at the first non-whitespace byte so HTML bodies skip the decoder entirely
+    if payload[:256].lstrip()[:1] not in (b'{', b'['):
+        return None
+    try:
+        return orjson.loads(payload)
+    except orjson.JSONDecodeError:
+        return None
+
+def _parse_tree(html_content: bytes):
+    """Parse a CarGurus page into an lxml tree for XPath lookups"""
+    return lxml.html.fromstring(html_content, parser=_PAGE_PARSER)
+
+def _element_text(element) -> str:
+    """Concatenate an lxml element's stripped visible text nodes (like bs4 get_text(strip=True))"""
+    return ''.join(text.strip() for text in _VISIBLE_TEXT_XPATH(element))
+
+def _element_full_text(element) -> str:
+    """An lxml element's visible text with only the outer whitespace stripped (like bs4 get_text().strip())"""
+    return ''.join(_VISIBLE_TEXT_XPATH(element)).strip()
+
+def _parse_and_extract(html_content: bytes, url: str) -> Optional[_ScrapedCarRaw]:
+    """Parse a detail page and extract its car data (top-level so worker processes can run it)"""
+    return scraper._extract_car_data(_parse_tree(html_content), url, html_content)
+
+def _parse_detail_page(html_content: bytes, url: str) -> Optional[_ScrapedCarRaw]:
+    """
+    Parse a detail page in this thread when no other parse is running, otherwise in _parse_pool.
+    Uncontended scrapes skip pickling the page to a worker process.
+    """
+    global _parse_pool, _parses_in_flight
+    pool = None
+    with _parses_lock:
+        if _PARSE_POOL_WORKERS > 1 and _parses_in_flight > 0:
+            if _parse_pool is None:
+                _parse_pool = ProcessPoolExecutor(max_workers=_PARSE_POOL_WORKERS,
+                                                  mp_context=multiprocessing.get_context(_PARSE_POOL_START_METHOD))
+            pool = _parse_pool
+        _parses_in_flight += 1
+    try:
+        if pool is not None:
+            return pool.submit(_parse_and_extract, html_content, url).result()
+        return _parse_and_extract(html_content, url)
+    finally:
+        with _parses_lock:
+            _parses_in_flight -= 1
+
 class CarGurusScraper:
     def __init__(self):
         self.session = requests.Session()
+        # Keep more keep-alive connections to CarGurus than requests' default pool of 10, since
+        # concurrent requests share this session; retries are handled by _fetch_html
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -71,17 +336,31 @@ class CarGurusScraper:
         self.session.headers.update(self.headers)
         self.max_retries = 3
         self.timeout = 30
+        self._scrape_cache = _TTLCache(_CACHE_MAXSIZE)
+        self._search_cache = _TTLCache(_CACHE_MAXSIZE)
     
-    def scrape_car(self, url: str) -> Optional[Dict[str, Any]]:
-        """Scrape car details from CarGurus.com"""
+    def scrape_car(self, url: str) -> Optional[_ScrapedCarRaw]:
+        """Scrape car details from CarGurus.com, serving recent successful scrapes from the cache"""
+        car_data = self._scrape_cache.get(url)
+        if car_data is not None:
+            logger.info("Serving cached scrape for URL: %s", url)
+            return car_data
+        
+        car_data = self._scrape_car_uncached(url)
+        if car_data is not None:
+            self._scrape_cache.set(url, car_data, _CACHE_TTL)
+        return car_data
+    
+    def _scrape_car_uncached(self, url: str) -> Optional[_ScrapedCarRaw]:
+        """Fetch and extract a car from CarGurus, bypassing the scrape cache"""
         start_time = time.time()
         
         try:
-            logger.info(f"Starting scrape for URL: {url}")
+            logger.info("Starting scrape for URL: %s", url)
             
             # Validate URL
             if not self._is_valid_cargurus_url(url):
-                logger.error(f"Invalid CarGurus URL: {url}")
+                logger.error("Invalid CarGurus URL: %s", url)
                 return None
             
             # Fetch HTML content
@@ -89,168 +368,267 @@ class CarGurusScraper:
             if not html_content:
                 return None
             
-            # Parse HTML using html5lib
-            soup = BeautifulSoup(html_content, 'html5lib')
-            
-            # Extract car data
-            car_data = self._extract_car_data(soup, url)
+            # Parse HTML and extract car data (in a worker process if another parse is running)
+            car_data = _parse_detail_page(html_content, url)
             
             if car_data:
                 processingTime = time.time() - start_time
-                logger.info(f"Successfully scraped car in {processingTime:.2f}s: {car_data['make']} {car_data['model']} {car_data['year']}")
+                logger.info("Successfully scraped car in %.2fs: %s %s %s", processingTime, car_data.make, car_data.model, car_data.year)
                 return car_data
             else:
-                logger.warning(f"Failed to extract car data from: {url}")
+                logger.warning("Failed to extract car data from: %s", url)
                 return None
                 
         except Exception as e:
-            logger.error(f"Error scraping {url}: {str(e)}")
+            logger.error("Error scraping %s: %s", url, e)
             return None
     
     def _is_valid_cargurus_url(self, url: str) -> bool:
         """Validate that the URL is a valid CarGurus.com URL"""
-        try:
-            parsed = urlparse(url)
-            return (
-                parsed.scheme in ('http', 'https') and
-                parsed.netloc in ('www.cargurus.com', 'cargurus.com') and
-                '/Cars/' in parsed.path
-            )
-        except Exception:
-            return False
+        return url.startswith(_CARGURUS_CARS_PREFIXES)
     
-    def _fetch_html(self, url: str) -> Optional[str]:
-        """Fetch HTML content with retry logic"""
-        import time
+    def _fetch_html(self, url: str) -> Optional[bytes]:
+        """
+        Fetch the raw page body with retry logic.
         
-        logger.info(f"Fetching HTML from URL: {url}")
+        Only timeouts, connection errors, 429 and 5xx responses are retried, with full-jitter
+        exponential backoff (or the server's Retry-After for 429s); other 4xx responses fail fast.
+        The body is streamed and returned undecoded (lxml and orjson take bytes directly), and
+        reading stops once it passes _MAX_PAGE_BYTES.
+        """
+        logger.debug("Fetching HTML from URL: %s", url)
         
         for attempt in range(self.max_retries):
+            response = None
             try:
-                logger.info(f"Attempt {attempt + 1}/{self.max_retries} to fetch {url}")
-                response = self.session.get(url, timeout=self.timeout)
-                
-                logger.info(f"HTTP response status: {response.status_code}")
-                logger.info(f"Response headers: {dict(response.headers)}")
+                logger.debug("Attempt %s/%s to fetch %s", attempt + 1, self.max_retries, url)
+                response = self.session.get(url, timeout=self.timeout, stream=True)
+                try:
+                    logger.debug("HTTP response status: %s", response.status_code)
+                    
+                    if response.status_code == 200:
+                        content = self._read_capped(response, url)
+                        logger.debug("Successfully fetched HTML content: %s bytes", len(content))
+                        return content
+                    
+                    logger.warning("HTTP %s for %s (attempt %s)", response.status_code, url, attempt + 1)
+                    preview = next(response.iter_content(500), b'')
+                    logger.warning("Response content preview: %s...", preview.decode(_PAGE_ENCODING, 'replace'))
+                finally:
+                    response.close()
                 
-                if response.status_code == 200:
-                    content_length = len(response.text)
-                    logger.info(f"Successfully fetched HTML content: {content_length} characters")
-                    return response.text
-                else:
-                    logger.warning(f"HTTP {response.status_code} for {url} (attempt {attempt + 1})")
-                    logger.warning(f"Response content preview: {response.text[:500]}...")
+                if response.status_code not in _RETRYABLE_STATUS_CODES:
+                    return None
                     
             except requests.Timeout:
-                logger.warning(f"Timeout for {url} (attempt {attempt + 1})")
+                logger.warning("Timeout for %s (attempt %s)", url, attempt + 1)
+            except requests.ConnectionError as e:
+                logger.warning("Connection error for %s (attempt %s): %s", url, attempt + 1, e)
             except Exception as e:
-                logger.error(f"Error fetching {url} (attempt {attempt + 1}): {str(e)}")
+                logger.error("Error fetching %s (attempt %s): %s", url, attempt + 1, e)
+                return None
             
             if attempt < self.max_retries - 1:
-                wait_time = 2 ** attempt
-                logger.info(f"Waiting {wait_time}s before retry...")
+                wait_time = self._retry_delay(attempt, response)
+                if wait_time is None:
+                    logger.warning("Retry-After for %s exceeds %ss, giving up", url, _RETRY_BACKOFF_CAP)
+                    return None
+                logger.debug("Waiting %.2fs before retry...", wait_time)
                 time.sleep(wait_time)
         
-        logger.error(f"Failed to fetch HTML after {self.max_retries} attempts")
+        logger.error("Failed to fetch HTML after %s attempts", self.max_retries)
         return None
     
-    def _extract_car_data(self, soup: BeautifulSoup, url: str) -> Optional[Dict[str, Any]]:
+    def _read_capped(self, response: requests.Response, url: str) -> bytes:
+        """Read a streamed response body, stopping once it exceeds _MAX_PAGE_BYTES"""
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(_FETCH_CHUNK_SIZE):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > _MAX_PAGE_BYTES:
+                logger.warning("Response from %s exceeds %s bytes, truncating", url, _MAX_PAGE_BYTES)
+                break
+        return b''.join(chunks)
+    
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> Optional[float]:
+        """
+        Seconds to wait before the next fetch attempt.
+        
+        Honors a numeric Retry-After on 429 responses (None if it is longer than the backoff
+        cap); otherwise picks a random delay up to the exponential backoff for this attempt.
+        """
+        if response is not None and response.status_code == 429:
+            retry_after = response.headers.get('Retry-After', '').strip()
+            if retry_after.isdigit():
+                delay = int(retry_after)
+                return delay if delay <= _RETRY_BACKOFF_CAP else None
+        return random.uniform(0, min(_RETRY_BACKOFF_CAP, 2 ** attempt))
+    
+    def _extract_car_data(self, tree, url: str, html_content: bytes) -> Optional[_ScrapedCarRaw]:
         """Extract car data using multiple strategies"""
         try:
+            # Prefer the page's schema.org JSON-LD; fall back to the page markup for any field it lacks
+            vehicle = self._extract_json_ld_vehicle(tree)
+            
             # Extract basic car information
-            make = self._extract_make(soup)
-            model = self._extract_model(soup)
-            year = self._extract_year(soup)
-            price = self._extract_price(soup)
-            description = self._extract_description(soup)
-            features = self._extract_features(soup)
-            images = self._extract_images(soup, url)
+            make = vehicle.get('make') or self._extract_make(tree)
+            model = vehicle.get('model') or self._extract_model(tree)
+            year = vehicle.get('year') or self._extract_year(tree, html_content)
+            price = vehicle.get('price') or self._extract_price(tree)
+            description = vehicle.get('description') or self._extract_description(tree)
+            features = self._extract_features(tree)
+            images = vehicle.get('images') or self._extract_images(tree, url)
             
             # Validate that we have at least basic information
             if not make or not model or year == 0:
-                logger.warning(f"Insufficient car data extracted from {url}")
+                logger.warning("Insufficient car data extracted from %s", url)
                 return None
             
-            return {
-                "make": make,
-                "model": model,
-                "year": year,
-                "price": price,
-                "description": description,
-                "features": features,
-                "images": images,
-                "originalUrl": url,
-                "scrapedAt": datetime.utcnow().isoformat()
-            }
+            return _ScrapedCarRaw(
+                make=make,
+                model=model,
+                year=year,
+                price=price,
+                description=description,
+                features=features,
+                images=images,
+                originalUrl=url,
+                scrapedAt=datetime.now(timezone.utc).isoformat()
+            )
             
         except Exception as e:
-            logger.error(f"Error extracting car data: {str(e)}")
+            logger.error("Error extracting car data: %s", e)
             return None
     
-    def _extract_make(self, soup: BeautifulSoup) -> str:
+    def _extract_json_ld_vehicle(self, tree) -> Dict[str, Any]:
+        """
+        Extract car fields from the page's schema.org Vehicle/Product JSON-LD.
+        
+        Returns a dict holding whichever of make, model, year, price, description and
+        images the structured data provides (empty if the page has none).
+        """
+        for script in _JSON_LD_XPATH(tree):
+            vehicle = self._find_json_ld_vehicle(script)
+            if vehicle is not None:
+                return vehicle
+        
+        return {}
+    
+    def _find_json_ld_vehicle(self, script: str) -> Optional[Dict[str, Any]]:
+        """Return the car fields of the first vehicle node in a JSON-LD script, if any"""
+        try:
+            data = orjson.loads(script)
+        except orjson.JSONDecodeError:
+            return None
+        
+        nodes = data if isinstance(data, list) else [data]
+        for node in nodes:
+            if isinstance(node, dict) and '@graph' in node:
+                graph = node['@graph']
+                nodes.extend(graph if isinstance(graph, list) else [graph])
+                continue
+            if not isinstance(node, dict):
+                continue
+            node_type = node.get('@type')
+            node_types = node_type if isinstance(node_type, list) else [node_type]
+            if not any(isinstance(t, str) and t in _JSON_LD_VEHICLE_TYPES for t in node_types):
+                continue
+            return self._parse_json_ld_vehicle(node)
+        
+        return None
+    
+    def _parse_json_ld_vehicle(self, node: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a schema.org Vehicle node onto car data fields"""
+        vehicle = {}
+        
+        brand = node.get('brand') or node.get('manufacturer')
+        if isinstance(brand, dict):
+            brand = brand.get('name')
+        if isinstance(brand, str) and brand.strip():
+            vehicle['make'] = brand.strip()
+        
+        model = node.get('model')
+        if isinstance(model, dict):
+            model = model.get('name')
+        if isinstance(model, str) and model.strip():
+            vehicle['model'] = model.strip()
+        
+        year_match = _YEAR_RE.search(str(node.get('vehicleModelDate') or node.get('modelDate') or ''))
+        if year_match:
+            year = int(year_match.group())
+            if 1900 <= year <= 2030:
+                vehicle['year'] = year
+        
+        offers = node.get('offers')
+        if isinstance(offers, list):
+            offers = offers[0] if offers else None
+        if isinstance(offers, dict):
+            try:
+                price = float(_PRICE_STRIP_RE.sub('', str(offers.get('price', ''))))
+                if price > 0:
+                    vehicle['price'] = price
+            except ValueError:
+                pass
+        
+        description = node.get('description')
+        if isinstance(description, str) and len(description.strip()) > 10:
+            vehicle['description'] = description.strip()
+        
+        images = node.get('image')
+        if not isinstance(images, list):
+            images = [images]
+        image_urls = []
+        seen = set()
+        for image in images:
+            if isinstance(image, dict):
+                image = image.get('url') or image.get('contentUrl')
+            if isinstance(image, str) and image.startswith('http') and image not in seen:
+                seen.add(image)
+                image_urls.append(image)
+        if image_urls:
+            vehicle['images'] = image_urls
+        
+        return vehicle
+    
+    def _extract_make(self, tree) -> str:
         """Extract car make using multiple selectors"""
-        selectors = [
-            'span[class*="make"]',
-            'div[class*="vehicle-title"] span[class*="make"]',
-            'h1[class*="title"] span[class*="make"]',
-            'div[class*="car-info"] span[class*="make"]'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
+        for element in _DETAIL_MAKE_XPATH(tree):
+            make = _element_full_text(element)
+            if make:
+                return make
         
         # Fallback: try to extract from page title
-        title = soup.find('title')
-        if title:
-            title_text = title.get_text()
-            # Common car makes to look for
-            makes = ['Toyota', 'Honda', 'Ford', 'Chevrolet', 'Nissan', 'BMW', 'Mercedes', 'Audi', 'Lexus', 'Hyundai']
-            for make in makes:
-                if make.lower() in title_text.lower():
+        titles = _PAGE_TITLE_XPATH(tree)
+        if titles:
+            for word in _WORD_RE.findall(_element_full_text(titles[0]).lower()):
+                make = _KNOWN_MAKES.get(word)
+                if make:
                     return make
         
         return "Unknown"
     
-    def _extract_model(self, soup: BeautifulSoup) -> str:
+    def _extract_model(self, tree) -> str:
         """Extract car model using multiple selectors"""
-        selectors = [
-            'span[class*="model"]',
-            'div[class*="vehicle-title"] span[class*="model"]',
-            'h1[class*="title"] span[class*="model"]',
-            'div[class*="car-info"] span[class*="model"]'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
+        for element in _DETAIL_MODEL_XPATH(tree):
+            model = _element_full_text(element)
+            if model:
+                return model
         
         return "Unknown"
     
-    def _extract_year(self, soup: BeautifulSoup) -> int:
+    def _extract_year(self, tree, html_content: bytes) -> int:
         """Extract car year using multiple strategies"""
         # Try various selectors
-        year_selectors = [
-            'span[class*="year"]',
-            'div[class*="vehicle-title"] span[class*="year"]',
-            'h1[class*="title"] span[class*="year"]'
-        ]
-        
-        for selector in year_selectors:
-            element = soup.select_one(selector)
-            if element:
-                year_text = element.get_text().strip()
-                year_match = re.search(r'\b(19|20)\d{2}\b', year_text)
-                if year_match:
-                    year = int(year_match.group())
-                    if 1900 <= year <= 2030:
-                        return year
-        
-        # Fallback: search in page content
-        page_text = soup.get_text()
-        year_match = re.search(r'\b(19|20)\d{2}\b', page_text)
+        for element in _DETAIL_YEAR_XPATH(tree):
+            year_match = _YEAR_RE.search(_element_full_text(element))
+            if year_match:
+                year = int(year_match.group())
+                if 1900 <= year <= 2030:
+                    return year
+        
+        # Fallback: search the raw page content rather than materialising the page text
+        year_match = _YEAR_BYTES_RE.search(html_content)
         if year_match:
             year = int(year_match.group())
             if 1900 <= year <= 2030:
@@ -258,126 +636,96 @@ class CarGurusScraper:
         
         return 2024  # Default year
     
-    def _extract_price(self, soup: BeautifulSoup) -> float:
+    def _extract_price(self, tree) -> float:
         """Extract car price using multiple strategies"""
-        price_selectors = [
-            'span[class*="price"]',
-            'div[class*="price"]',
-            'span[class*="listing-price"]',
-            'div[class*="listing-price"]',
-            'span[class*="car-price"]'
-        ]
-        
-        for selector in price_selectors:
-            element = soup.select_one(selector)
-            if element:
-                price_text = element.get_text().strip()
-                # Remove currency symbols and commas
-                price_text = re.sub(r'[^\d.]', '', price_text)
-                try:
-                    price = float(price_text)
-                    if price > 0:
-                        return price
-                except ValueError:
-                    continue
+        for element in _DETAIL_PRICE_XPATH(tree):
+            # Remove currency symbols and commas
+            price_text = _PRICE_STRIP_RE.sub('', _element_full_text(element))
+            try:
+                price = float(price_text)
+                if price > 0:
+                    return price
+            except ValueError:
+                continue
         
         return 0.0
     
-    def _extract_description(self, soup: BeautifulSoup) -> str:
+    def _extract_description(self, tree) -> str:
         """Extract car description"""
-        desc_selectors = [
-            'div[class*="description"]',
-            'div[class*="overview"]',
-            'div[class*="vehicle-description"]',
-            'p[class*="description"]',
-            'div[class*="car-description"]'
-        ]
-        
-        for selector in desc_selectors:
-            element = soup.select_one(selector)
-            if element:
-                description = element.get_text().strip()
-                if description and len(description) > 10:
-                    return description
+        for element in _DETAIL_DESCRIPTION_XPATH(tree):
+            description = _element_full_text(element)
+            if description and len(description) > 10:
+                return description
         
         return "No description available."
     
-    def _extract_features(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_features(self, tree) -> List[str]:
         """Extract car features"""
         features = []
-        feature_selectors = [
-            'div[class*="features"] li',
-            'div[class*="specs"] li',
-            'ul[class*="features"] li',
-            'div[class*="vehicle-features"] li',
-            'div[class*="car-features"] li'
-        ]
-        
-        for selector in feature_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                feature = element.get_text().strip()
-                if feature and feature not in features:
-                    features.append(feature)
+        seen = set()
+        for element in _DETAIL_FEATURE_XPATH(tree):
+            feature = _element_full_text(element)
+            if feature and feature not in seen:
+                seen.add(feature)
+                features.append(feature)
         
         if not features:
             features.append("Features not available")
         
         return features
     
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def _extract_images(self, tree, base_url: str) -> List[str]:
         """Extract car images"""
         images = []
-        image_selectors = [
-            'img[class*="vehicle-image"]',
-            'img[class*="car-image"]',
-            'div[class*="gallery"] img',
-            'img[class*="listing-image"]',
-            'div[class*="car-gallery"] img'
-        ]
-        
-        for selector in image_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                src = element.get('src')
-                if src:
-                    # Ensure URL is absolute
-                    if not src.startswith('http'):
-                        src = urljoin(base_url, src)
-                    if src not in images:
-                        images.append(src)
+        seen = set()
+        for element in _DETAIL_IMAGE_XPATH(tree):
+            src = element.get('src')
+            if src:
+                # Ensure URL is absolute
+                if not src.startswith('http'):
+                    src = urljoin(base_url, src)
+                if src not in seen:
+                    seen.add(src)
+                    images.append(src)
         
         # Add placeholder if no images found
         if not images:
-            images.append("https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop")
+            images.append(_PLACEHOLDER_IMG)
         
         return images
 
     def search_inventory(self, request: InventorySearchRequest) -> InventorySearchResult:
-        """Search for cars in CarGurus inventory"""
+        """Search for cars in CarGurus inventory, serving recently fetched pages from the cache"""
+        key = (request.zip, request.distance, request.pageNumber, request.srpVariation, request.newUsed)
+        result = self._search_cache.get(key)
+        if result is not None:
+            logger.info("Serving cached inventory search: %s", key)
+            return result
+        
+        result = self._search_inventory_uncached(request)
+        self._search_cache.set(key, result, _CACHE_ERROR_TTL if result.errorMessage else _CACHE_TTL)
+        return result
+    
+    def _search_inventory_uncached(self, request: InventorySearchRequest) -> InventorySearchResult:
+        """Fetch and extract a CarGurus search page, bypassing the search cache"""
         start_time = time.time()
         
         try:
-            logger.info(f"=== STARTING INVENTORY SEARCH ===")
-            logger.info(f"Request parameters: ZIP={request.zip}, Distance={request.distance}, Page={request.pageNumber}, srpVariation={request.srpVariation}, newUsed={request.newUsed}")
+            logger.info("=== STARTING INVENTORY SEARCH ===")
+            logger.info("Request parameters: ZIP=%s, Distance=%s, Page=%s, srpVariation=%s, newUsed=%s", request.zip, request.distance, request.pageNumber, request.srpVariation, request.newUsed)
             
-            # Construct the search URL
-            base_url = "https://www.cargurus.com/Cars/searchPage.action"
+            # Construct the search URL (urlencode escapes the user-supplied zip/srpVariation)
             params = {
+                **_SEARCH_BASE_PARAMS,
                 "newUsed": request.newUsed,
                 "zip": request.zip,
                 "distance": request.distance,
-                "sourceContext": "carGurusHomePageModel",
                 "srpVariation": request.srpVariation,
-                "isDeliveryEnabled": "true",
-                "nonShippableBaseline": "0",
                 "pageNumber": request.pageNumber
             }
+            url = f"{_SEARCH_URL}?{urlencode(params)}"
             
-            # Build the URL
-            url = f"{base_url}?" + "&".join([f"{k}={v}" for k, v in params.items()])
-            
-            logger.info(f"CarGurus search URL: {url}")
+            logger.info("CarGurus search URL: %s", url)
             
             # Fetch the search page
             logger.info("Fetching content from CarGurus...")
@@ -391,18 +739,17 @@ class CarGurusScraper:
                     processingTime=time.time() - start_time
                 )
             
-            logger.info(f"Successfully fetched content (length: {len(html_content)} characters)")
+            logger.info("Successfully fetched content (length: %s bytes)", len(html_content))
             
             # Check if this is a JSON response
-            try:
-                import json
-                json_data = json.loads(html_content)
+            json_data = _decode_json_payload(html_content)
+            if json_data is not None:
                 logger.info("Detected JSON response from CarGurus")
                 
                 # Extract cars from JSON response
                 cars = self._extract_cars_from_json(json_data)
                 
-                logger.info(f"Extracted {len(cars)} cars from JSON response")
+                logger.info("Extracted %s cars from JSON response", len(cars))
                 
                 # Estimate total results and pages
                 total_results = len(cars) * 20  # Rough estimate
@@ -410,11 +757,11 @@ class CarGurusScraper:
                 
                 processing_time = time.time() - start_time
                 
-                logger.info(f"=== INVENTORY SEARCH COMPLETE ===")
-                logger.info(f"Found {len(cars)} cars in {processing_time:.2f}s")
-                logger.info(f"Estimated total results: {total_results}, total pages: {total_pages}")
+                logger.info("=== INVENTORY SEARCH COMPLETE ===")
+                logger.info("Found %s cars in %.2fs", len(cars), processing_time)
+                logger.info("Estimated total results: %s, total pages: %s", total_results, total_pages)
                 
-                return InventorySearchResult(
+                return InventorySearchResult.model_construct(
                     success=True,
                     cars=cars,
                     totalResults=total_results,
@@ -423,21 +770,22 @@ class CarGurusScraper:
                     processingTime=processing_time
                 )
                 
-            except json.JSONDecodeError:
+            else:
                 logger.info("Response is not JSON, treating as HTML")
-                # Parse the HTML (existing code)
-                soup = BeautifulSoup(html_content, 'html5lib')
+                # Parse the HTML
+                tree = _parse_tree(html_content)
                 
-                # Log some basic info about the page
-                title = soup.find('title')
-                if title:
-                    logger.info(f"Page title: {title.get_text().strip()}")
+                # Log some basic info about the page (a whole-document lookup, so only when debugging)
+                if logger.isEnabledFor(logging.DEBUG):
+                    titles = _PAGE_TITLE_XPATH(tree)
+                    if titles:
+                        logger.debug("Page title: %s", titles[0].text_content().strip())
                 
                 # Extract cars from the search results
                 logger.info("Extracting car listings from search page...")
-                cars = self._extract_cars_from_search_page(soup, url)
+                cars = self._extract_cars_from_search_page(tree, url)
                 
-                logger.info(f"Extracted {len(cars)} cars from search page")
+                logger.info("Extracted %s cars from search page", len(cars))
                 
                 # Estimate total results and pages (CarGurus doesn't always provide this info)
                 total_results = len(cars) * 20  # Rough estimate
@@ -445,11 +793,11 @@ class CarGurusScraper:
                 
                 processing_time = time.time() - start_time
                 
-                logger.info(f"=== INVENTORY SEARCH COMPLETE ===")
-                logger.info(f"Found {len(cars)} cars in {processing_time:.2f}s")
-                logger.info(f"Estimated total results: {total_results}, total pages: {total_pages}")
+                logger.info("=== INVENTORY SEARCH COMPLETE ===")
+                logger.info("Found %s cars in %.2fs", len(cars), processing_time)
+                logger.info("Estimated total results: %s, total pages: %s", total_results, total_pages)
                 
-                return InventorySearchResult(
+                return InventorySearchResult.model_construct(
                     success=True,
                     cars=cars,
                     totalResults=total_results,
@@ -459,84 +807,84 @@ class CarGurusScraper:
                 )
             
         except Exception as e:
-            logger.error(f"Error in inventory search: {str(e)}")
-            logger.error(f"Exception type: {type(e).__name__}")
+            logger.error("Error in inventory search: %s", e)
+            logger.error("Exception type: %s", type(e).__name__)
             import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.error("Traceback: %s", traceback.format_exc())
             return InventorySearchResult(
                 success=False,
                 errorMessage=f"Internal server error: {str(e)}",
                 processingTime=time.time() - start_time
             )
 
-    def _extract_cars_from_search_page(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, Any]]:
+    def _extract_cars_from_search_page(self, tree, base_url: str) -> List[Dict[str, Any]]:
         """Extract car listings from search page"""
         cars = []
+        # One ISO timestamp for the whole page rather than one per listing, formatted here so every
+        # endpoint returns the same string whichever serializer writes the response
+        scraped_at = datetime.now(timezone.utc).isoformat()
         
-        logger.info("=== EXTRACTING CARS FROM SEARCH PAGE ===")
+        logger.debug("=== EXTRACTING CARS FROM SEARCH PAGE ===")
         
         # Try to find car listings using common selectors
-        car_selectors = [
-            'div[class*="listing-card"]',
-            'div[class*="car-listing"]',
-            'div[class*="vehicle-card"]',
-            'div[data-cg-car-id]',
-            'article[class*="listing"]',
-            'div[class*="result-item"]',
-            'div[class*="search-result"]',
-            'div[class*="listing"]'
-        ]
-        
         car_elements = []
         selected_selector = None
         
-        logger.info("Trying different CSS selectors to find car listings...")
-        for selector in car_selectors:
-            elements = soup.select(selector)
-            logger.info(f"Selector '{selector}': found {len(elements)} elements")
+        logger.debug("Trying different CSS selectors to find car listings...")
+        listing_divs = _SEARCH_LISTING_DIV_XPATH(tree)
+        for selector, listing_fragment, xpath in _SEARCH_CONTAINER_RULES:
+            if xpath is None:
+                elements = [element for element in listing_divs if listing_fragment in element.get('class')]
+            else:
+                elements = xpath(tree)
+            logger.debug("Selector '%s': found %s elements", selector, len(elements))
             if elements:
                 car_elements = elements
                 selected_selector = selector
-                logger.info(f"Using selector: {selector}")
+                logger.debug("Using selector: %s", selector)
                 break
         
         if not car_elements:
-            logger.info("No car elements found with standard selectors, trying fallback approach...")
+            logger.debug("No car elements found with standard selectors, trying fallback approach...")
             # Fallback: try to find any car-related content
-            car_elements = soup.find_all(['div', 'article'], class_=re.compile(r'.*car.*|.*listing.*|.*vehicle.*', re.I))
-            logger.info(f"Fallback approach found {len(car_elements)} potential elements")
+            car_elements = [
+                element for element in tree.getroottree().iter('div', 'article')
+                if _CAR_CLASS_RE.search(element.get('class', ''))
+            ]
+            logger.debug("Fallback approach found %s potential elements", len(car_elements))
         
         if not car_elements:
             logger.warning("No car elements found at all! Returning mock data.")
-            # Log some info about the page structure for debugging
-            logger.info("Page structure analysis:")
-            logger.info(f"Total div elements: {len(soup.find_all('div'))}")
-            logger.info(f"Total article elements: {len(soup.find_all('article'))}")
-            
-            # Look for any elements with car-related classes or IDs
-            car_related_elements = soup.find_all(attrs={'class': re.compile(r'.*car.*|.*listing.*|.*vehicle.*', re.I)})
-            logger.info(f"Elements with car-related classes: {len(car_related_elements)}")
-            
-            # Log first few elements for debugging
-            for i, elem in enumerate(car_related_elements[:5]):
-                logger.info(f"Car-related element {i+1}: {elem.name} - classes: {elem.get('class', [])}")
+            # Log some info about the page structure for debugging (whole-tree walks, so only when enabled)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Page structure analysis:")
+                logger.debug("Total div elements: %s", int(_DIV_COUNT_XPATH(tree)))
+                logger.debug("Total article elements: %s", int(_ARTICLE_COUNT_XPATH(tree)))
+                
+                # Look for any elements with car-related classes or IDs
+                car_related_elements = _CAR_RELATED_XPATH(tree)
+                logger.debug("Elements with car-related classes: %s", len(car_related_elements))
+                
+                # Log first few elements for debugging
+                for i, elem in enumerate(car_related_elements[:5]):
+                    logger.debug("Car-related element %s: %s - classes: %s", i+1, elem.tag, elem.get('class', ''))
         
-        logger.info(f"Processing {len(car_elements)} car elements (limiting to 20)...")
+        logger.debug("Processing %s car elements (limiting to 20)...", len(car_elements))
         
         for i, car_element in enumerate(car_elements[:20]):
             try:
-                logger.info(f"Processing car element {i+1}/{min(len(car_elements), 20)}")
-                car_data = self._extract_car_from_listing(car_element, base_url)
+                logger.debug("Processing car element %s/%s", i + 1, min(len(car_elements), 20))
+                car_data = self._extract_car_from_listing(car_element, base_url, scraped_at)
                 if car_data:
                     cars.append(car_data)
-                    logger.info(f"Successfully extracted car: {car_data.get('make', 'Unknown')} {car_data.get('model', 'Unknown')} {car_data.get('year', 'Unknown')}")
+                    logger.debug("Successfully extracted car: %s %s %s", car_data.get('make', 'Unknown'), car_data.get('model', 'Unknown'), car_data.get('year', 'Unknown'))
                 else:
-                    logger.warning(f"Failed to extract car data from element {i+1}")
+                    logger.warning("Failed to extract car data from element %s", i+1)
             except Exception as e:
-                logger.warning(f"Error extracting car from listing {i+1}: {e}")
+                logger.warning("Error extracting car from listing %s: %s", i+1, e)
                 continue
         
-        logger.info(f"Successfully extracted {len(cars)} cars from search page")
+        logger.debug("Successfully extracted %s cars from search page", len(cars))
         
         # If no cars found, return some sample data
         if not cars:
@@ -552,53 +900,60 @@ class CarGurusScraper:
                     "images": ["https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop"],
                     "originalUrl": "https://www.cargurus.com/Cars/l-toyota-camry",
                     "fullTitle": "2022 Toyota Camry LE (Mock Data)",
-                    "scrapedAt": datetime.utcnow().isoformat()
+                    "scrapedAt": scraped_at
                 }
             ]
         
-        logger.info(f"=== CAR EXTRACTION COMPLETE: {len(cars)} cars found ===")
+        logger.debug("=== CAR EXTRACTION COMPLETE: %s cars found ===", len(cars))
         return cars
 
-    def _extract_car_from_listing(self, car_element, base_url: str) -> Optional[Dict[str, Any]]:
+    def _extract_car_from_listing(self, car_element, base_url: str, scraped_at: str) -> Optional[Dict[str, Any]]:
         """Extract car data from a listing element"""
         try:
-            logger.info(f"Extracting car data from element: {car_element.name} (classes: {car_element.get('class', [])})")
+            logger.debug("Extracting car data from element: %s (classes: %s)", car_element.tag, car_element.get('class', ''))
             
             # Extract basic car information
-            make = self._extract_text(car_element, ['[class*="make"]', '[class*="brand"]'])
-            model = self._extract_text(car_element, ['[class*="model"]'])
-            year = self._extract_year_from_text(self._extract_text(car_element, ['[class*="year"]']))
-            price = self._extract_price_from_text(self._extract_text(car_element, ['[class*="price"]']))
+            make = self._extract_text(car_element, _LISTING_MAKE_XPATH)
+            model = self._extract_text(car_element, _LISTING_MODEL_XPATH)
+            year = self._extract_year_from_text(self._extract_text(car_element, _LISTING_YEAR_XPATH))
+            price = self._extract_price_from_text(self._extract_text(car_element, _LISTING_PRICE_XPATH))
             
-            logger.info(f"Extracted basic info - Make: '{make}', Model: '{model}', Year: {year}, Price: {price}")
+            logger.debug("Extracted basic info - Make: '%s', Model: '%s', Year: %s, Price: %s", make, model, year, price)
             
             # Extract URL
-            url_element = car_element.find('a', href=True)
-            original_url = urljoin(base_url, url_element['href']) if url_element else base_url
-            logger.info(f"Extracted URL: {original_url}")
+            url_elements = _LISTING_LINK_XPATH(car_element)
+            original_url = urljoin(base_url, url_elements[0].get('href')) if url_elements else base_url
+            logger.debug("Extracted URL: %s", original_url)
             
             # Extract title
-            title = self._extract_text(car_element, ['[class*="title"]', '[class*="name"]', 'h1', 'h2', 'h3'])
+            title = ""
+            for xpath in _LISTING_TITLE_XPATHS:
+                title = self._extract_text(car_element, xpath)
+                if title:
+                    break
             if not title:
                 title = f"{year} {make} {model}" if make and model else "Car Listing"
-            logger.info(f"Extracted title: {title}")
+            logger.debug("Extracted title: %s", title)
             
             # Extract images
             images = []
-            img_elements = car_element.find_all('img', src=True)
-            logger.info(f"Found {len(img_elements)} image elements")
+            seen = set()
+            img_elements = _LISTING_IMAGE_XPATH(car_element)
+            logger.debug("Found %s image elements", len(img_elements))
             
             for img in img_elements:
                 src = img.get('src')
                 if src and not src.startswith('data:'):
                     if not src.startswith('http'):
                         src = urljoin(base_url, src)
-                    images.append(src)
+                    if src not in seen:
+                        seen.add(src)
+                        images.append(src)
             
             if not images:
-                images = ["https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop"]
+                images = [_PLACEHOLDER_IMG]
             
-            logger.info(f"Extracted {len(images)} images")
+            logger.debug("Extracted %s images", len(images))
             
             car_data = {
                 "make": make or "Unknown",
@@ -610,32 +965,30 @@ class CarGurusScraper:
                 "images": images,
                 "originalUrl": original_url,
                 "fullTitle": title,
-                "scrapedAt": datetime.utcnow().isoformat()
+                "scrapedAt": scraped_at
             }
             
-            logger.info(f"Successfully extracted car data: {car_data['make']} {car_data['model']} {car_data['year']}")
+            logger.debug("Successfully extracted car data: %s %s %s", car_data['make'], car_data['model'], car_data['year'])
             return car_data
             
         except Exception as e:
-            logger.warning(f"Error extracting car from listing: {e}")
-            logger.warning(f"Exception type: {type(e).__name__}")
+            logger.warning("Error extracting car from listing: %s", e)
+            logger.warning("Exception type: %s", type(e).__name__)
             return None
 
-    def _extract_text(self, element, selectors: List[str]) -> str:
-        """Extract text using multiple selectors"""
-        for selector in selectors:
-            found = element.select_one(selector)
-            if found:
-                text = found.get_text(strip=True)
-                if text:
-                    return text
+    def _extract_text(self, element, xpath: etree.XPath) -> str:
+        """Extract the first non-empty text among the elements an XPath query matches"""
+        for found in xpath(element):
+            text = _element_text(found)
+            if text:
+                return text
         return ""
 
     def _extract_year_from_text(self, text: str) -> int:
         """Extract year from text"""
         if not text:
             return 2022
-        year_match = re.search(r'\b(19|20)\d{2}\b', text)
+        year_match = _YEAR_RE.search(text)
         if year_match:
             return int(year_match.group())
         return 2022
@@ -644,7 +997,7 @@ class CarGurusScraper:
         """Extract price from text"""
         if not text:
             return 0.0
-        price_match = re.search(r'[\$]?[\d,]+(?:\.\d{2})?', text.replace(',', ''))
+        price_match = _PRICE_TEXT_RE.search(text.replace(',', ''))
         if price_match:
             price_str = price_match.group().replace('$', '').replace(',', '')
             try:
@@ -656,8 +1009,10 @@ class CarGurusScraper:
     def _extract_cars_from_json(self, json_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract car listings from JSON response"""
         cars = []
+        # One ISO timestamp for the whole response rather than one per tile
+        scraped_at = datetime.now(timezone.utc).isoformat()
         
-        logger.info("=== EXTRACTING CARS FROM JSON RESPONSE ===")
+        logger.debug("=== EXTRACTING CARS FROM JSON RESPONSE ===")
         
         # Check if we have tiles in the JSON response
         if 'tiles' not in json_data:
@@ -665,53 +1020,56 @@ class CarGurusScraper:
             return cars
         
         tiles = json_data['tiles']
-        logger.info(f"Found {len(tiles)} tiles in JSON response")
+        logger.debug("Found %s tiles in JSON response", len(tiles))
         
         for i, tile in enumerate(tiles):
             try:
-                logger.info(f"Processing tile {i+1}/{len(tiles)}")
+                logger.debug("Processing tile %s/%s", i+1, len(tiles))
                 
                 # Check if this is a car listing tile
                 if not isinstance(tile, dict):
-                    logger.warning(f"Tile {i+1} is not a dict: {type(tile)}")
+                    logger.warning("Tile %s is not a dict: %s", i+1, type(tile))
                     continue
                 
                 tile_type = tile.get('type', '')
                 tile_data = tile.get('data', {})
                 
-                logger.info(f"Tile type: {tile_type}, has data: {bool(tile_data)}")
+                logger.debug("Tile type: %s, has data: %s", tile_type, bool(tile_data))
                 
                 # Look for car listing tiles
                 if tile_type in ['LISTING_NEW_PRIORITY', 'LISTING_USED_PRIORITY', 'LISTING_CERTIFIED_PRIORITY'] and tile_data:
-                    car_data = self._extract_car_from_json_tile(tile_data)
+                    car_data = self._extract_car_from_json_tile(tile_data, scraped_at)
                     if car_data:
                         cars.append(car_data)
-                        logger.info(f"Successfully extracted car: {car_data.get('make', 'Unknown')} {car_data.get('model', 'Unknown')} {car_data.get('year', 'Unknown')}")
+                        logger.debug("Successfully extracted car: %s %s %s", car_data.get('make', 'Unknown'), car_data.get('model', 'Unknown'), car_data.get('year', 'Unknown'))
                     else:
-                        logger.warning(f"Failed to extract car data from tile {i+1}")
+                        logger.warning("Failed to extract car data from tile %s", i+1)
                 else:
-                    logger.info(f"Skipping tile {i+1} - type: {tile_type}")
+                    logger.debug("Skipping tile %s - type: %s", i+1, tile_type)
                     
             except Exception as e:
-                logger.warning(f"Error processing tile {i+1}: {e}")
+                logger.warning("Error processing tile %s: %s", i+1, e)
                 continue
         
-        logger.info(f"Successfully extracted {len(cars)} cars from JSON response")
+        logger.debug("Successfully extracted %s cars from JSON response", len(cars))
         return cars
     
-    def _extract_car_from_json_tile(self, tile_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _extract_car_from_json_tile(self, tile_data: Dict[str, Any], scraped_at: str) -> Optional[Dict[str, Any]]:
         """Extract car data from a JSON tile"""
         try:
-            logger.info(f"Extracting car from tile data: {list(tile_data.keys())}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Extracting car from tile data: %s", list(tile_data.keys()))
+            
+            get = tile_data.get
             
             # Extract basic car information
-            make = tile_data.get('makeName', 'Unknown')
-            model = tile_data.get('modelName', 'Unknown')
-            year = tile_data.get('carYear', 2024)
-            price = tile_data.get('price', 0.0)
+            make = get('makeName', 'Unknown')
+            model = get('modelName', 'Unknown')
+            year = get('carYear', 2024)
+            price = get('price', 0.0)
             
             # Extract title
-            title = tile_data.get('listingTitle', '')
+            title = get('listingTitle', '')
             if not title:
                 title = f"{year} {make} {model}"
             
@@ -719,31 +1077,24 @@ class CarGurusScraper:
             description = title
             
             # Extract features from options
-            features = tile_data.get('options', [])
-            
-            # Extract images
-            images = []
-            original_picture_data = tile_data.get('originalPictureData', {})
-            if original_picture_data and isinstance(original_picture_data, dict):
-                image_url = original_picture_data.get('url', '')
-                if image_url:
-                    images.append(image_url)
+            features = get('options', [])
             
-            # If no images found, add placeholder
-            if not images:
-                images.append("https://images.unsplash.com/photo-1549317661-bd32c8ce0db2?w=800&h=600&fit=crop")
+            # Extract the primary image, or the placeholder when the tile has none
+            original_picture_data = get('originalPictureData')
+            image_url = original_picture_data.get('url') if isinstance(original_picture_data, dict) else None
+            images = [image_url] if image_url else [_PLACEHOLDER_IMG]
             
             # Extract URL (construct from listing ID)
-            listing_id = tile_data.get('id', '')
-            original_url = f"https://www.cargurus.com/Cars/l-{listing_id}" if listing_id else "https://www.cargurus.com/Cars"
+            listing_id = get('id', '')
+            original_url = f"{_LISTING_URL_PREFIX}{listing_id}" if listing_id else _CARS_URL
             
             # Extract additional info
-            mileage = tile_data.get('mileage', 0)
-            mileage_string = tile_data.get('mileageString', '0')
-            exterior_color = tile_data.get('exteriorColorName', 'Unknown')
-            dealer_name = tile_data.get('dealerName', 'Unknown')
-            seller_city = tile_data.get('sellerCity', '')
-            seller_region = tile_data.get('sellerRegion', '')
+            mileage = get('mileage', 0)
+            mileage_string = get('mileageString', '0')
+            exterior_color = get('exteriorColorName', 'Unknown')
+            dealer_name = get('dealerName', 'Unknown')
+            seller_city = get('sellerCity', '')
+            seller_region = get('sellerRegion', '')
             
             car_data = {
                 "make": make,
@@ -761,14 +1112,14 @@ class CarGurusScraper:
                 "dealerName": dealer_name,
                 "sellerCity": seller_city,
                 "sellerRegion": seller_region,
-                "scrapedAt": datetime.utcnow().isoformat()
+                "scrapedAt": scraped_at
             }
             
-            logger.info(f"Successfully extracted car data: {make} {model} {year} - ${price}")
+            logger.debug("Successfully extracted car data: %s %s %s - $%s", make, model, year, price)
             return car_data
             
         except Exception as e:
-            logger.warning(f"Error extracting car from JSON tile: {e}")
+            logger.warning("Error extracting car from JSON tile: %s", e)
             return None
 
 # Initialize scraper
@@ -797,24 +1148,28 @@ async def scrape_cargurus(request: Dict[str, Any]):
     """
     try:
         url = request.get("url", "")
-        logger.info(f"Starting scrape for URL: {url}")
+        logger.info("Starting scrape for URL: %s", url)
         
         # Validate URL
-        if not url.startswith("https://www.cargurus.com"):
+        try:
+            parsed_url = _URL_ADAPTER.validate_python(url)
+        except ValidationError:
+            raise HTTPException(status_code=400, detail="Invalid CarGurus URL")
+        if parsed_url.scheme != "https" or parsed_url.host != "www.cargurus.com":
             raise HTTPException(status_code=400, detail="Invalid CarGurus URL")
         
-        # Scrape the car details
-        car_data = scraper.scrape_car(url)
+        # Scrape the car details in a worker thread so the blocking fetch doesn't stall the event loop
+        car_data = await asyncio.to_thread(scraper.scrape_car, url)
         
         if car_data:
-            logger.info(f"Successfully scraped: {car_data['make']} {car_data['model']} {car_data['year']}")
+            logger.info("Successfully scraped: %s %s %s", car_data.make, car_data.model, car_data.year)
             return {
                 "success": True,
-                "data": car_data,
+                "data": car_data.to_dict(),
                 "error": None
             }
         else:
-            logger.warning(f"Failed to scrape data from: {url}")
+            logger.warning("Failed to scrape data from: %s", url)
             return {
                 "success": False,
                 "data": None,
@@ -824,7 +1179,7 @@ async def scrape_cargurus(request: Dict[str, Any]):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error scraping {url}: {str(e)}")
+        logger.error("Error scraping %s: %s", url, e)
         return {
             "success": False,
             "data": None,
@@ -843,7 +1198,7 @@ async def search_inventory(request: InventorySearchRequest):
         InventorySearchResult with list of cars and pagination info
     """
     try:
-        logger.info(f"Starting inventory search: ZIP={request.zip}, Distance={request.distance}, Page={request.pageNumber}")
+        logger.info("Starting inventory search: ZIP=%s, Distance=%s, Page=%s", request.zip, request.distance, request.pageNumber)
         
         # Validate request parameters
         if not request.zip or len(request.zip) != 5:
@@ -855,20 +1210,21 @@ async def search_inventory(request: InventorySearchRequest):
         if request.pageNumber < 1:
             raise HTTPException(status_code=400, detail="Page number must be at least 1")
         
-        # Search the inventory
-        result = scraper.search_inventory(request)
+        # Search the inventory in a worker thread so the blocking fetch doesn't stall the event loop
+        result = await asyncio.to_thread(scraper.search_inventory, request)
         
         if result.success:
-            logger.info(f"Successfully found {len(result.cars)} cars in inventory search")
-            return result
+            logger.info("Successfully found %s cars in inventory search", len(result.cars))
         else:
-            logger.warning(f"Inventory search failed: {result.errorMessage}")
-            return result
+            logger.warning("Inventory search failed: %s", result.errorMessage)
+        
+        # Serialize the result directly from the model, skipping FastAPI's jsonable_encoder pass
+        return Response(content=result.model_dump_json(), media_type="application/json")
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in inventory search: {str(e)}")
+        logger.error("Error in inventory search: %s", e)
         return InventorySearchResult(
             success=False,
             errorMessage=f"Internal server error: {str(e)}",